@@ -0,0 +1,24 @@
+"""
+Общие настройки pytest для тестов игры.
+pygame запускается без окна и звука и инициализируется один раз на сессию;
+для convert() заранее создаётся окно-заглушка 1x1.
+"""
+
+import os
+
+# Без реального окна и аудиоустройства (CI, сервер без дисплея)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session():
+    """Инициализирует pygame один раз на всю сессию тестов."""
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
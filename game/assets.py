@@ -9,6 +9,19 @@ from typing import Dict, Optional, Tuple
 from game.physics import Vector2D
 
 
+# Файлы спрайтов игрока по состояниям
+PLAYER_SPRITE_PATHS = {
+    'idle': 'assets/player/player_static.png',
+    'walk': 'assets/player/player_walk/0.png',  # Default walk frame
+    'jump': 'assets/player/player_jump.png',
+    'fall': 'assets/player/player_jump.png',  # Use jump sprite for falling if no separate fall sprite
+    'crouch': 'assets/player/player_shift.png'
+}
+
+# Номера файлов кадров ходьбы игрока по порядку анимации (файла 3.png нет)
+PLAYER_WALK_FRAME_NUMBERS = (0, 1, 2, 4, 5)
+
+
 class AssetManager:
     """
     Manages loading and caching of game assets.
@@ -16,9 +29,14 @@ class AssetManager:
     
     def __init__(self):
         self.images: Dict[str, pygame.Surface] = {}
+        self.scaled_images: Dict[Tuple[str, int, int], pygame.Surface] = {}  # Масштабированные копии
         self.fonts: Dict[str, pygame.font.Font] = {}
         self.loaded_themes: Dict[str, Dict] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}  # Добавляем звуки
+        self.flipped_images: Dict[pygame.Surface, pygame.Surface] = {}  # Отраженные копии
+        self.faded_images: Dict[Tuple[pygame.Surface, int], pygame.Surface] = {}  # Полупрозрачные копии
+        self.bear_sprite_sets: Dict[Tuple[int, int], Dict[str, pygame.Surface]] = {}  # Наборы спрайтов медведя
+        self.placeholders: Dict[Tuple, pygame.Surface] = {}  # Заглушки по (размер, цвет, текст)
         
         # Default placeholder colors
         self.placeholder_colors = {
@@ -42,6 +60,21 @@ class AssetManager:
         Returns:
             Loaded pygame Surface or None if failed
         """
+        if scale:
+            # Масштабированные копии кэшируются по (путь, размер): файл
+            # декодируется один раз, даже если нужен в нескольких размерах
+            key = (path, scale[0], scale[1])
+            if key in self.scaled_images:
+                return self.scaled_images[key]
+            
+            image = self.load_image(path)
+            if image is None:
+                return None
+            
+            scaled = pygame.transform.scale(image, scale)
+            self.scaled_images[key] = scaled
+            return scaled
+        
         if path in self.images:
             return self.images[path]
         
@@ -51,10 +84,16 @@ class AssetManager:
                 if pygame.get_init() and not pygame.display.get_init():
                     pygame.display.set_mode((1, 1))
                 
-                image = pygame.image.load(path).convert_alpha()
-                
-                if scale:
-                    image = pygame.transform.scale(image, scale)
+                image = pygame.image.load(path)
+                # Приводим к формату экрана один раз: JPEG без прозрачности -
+                # convert() (blit без альфа-смешивания), остальное - convert_alpha().
+                # Без видеорежима (дисплей инициализирован, окна нет) конвертировать
+                # не во что - оставляем изображение как загружено
+                if pygame.display.get_surface() is not None:
+                    if path.lower().endswith(('.jpg', '.jpeg')):
+                        image = image.convert()
+                    else:
+                        image = image.convert_alpha()
                 
                 self.images[path] = image
                 print(f"Loaded image: {path}")
@@ -72,14 +111,22 @@ class AssetManager:
         """
         Create a placeholder surface when image is missing.
         
+        Placeholders are cached by (size, color, text) like loaded images, so
+        flipped/faded copies keyed on the surface are reused as well.
+        
         Args:
             size: (width, height) of placeholder
             color: RGB color
             text: Optional text to draw on placeholder
             
         Returns:
-            Placeholder pygame Surface
+            Placeholder pygame Surface (shared, do not draw on it)
         """
+        key = (size[0], size[1], tuple(color), text)
+        cached = self.placeholders.get(key)
+        if cached is not None:
+            return cached
+        
         surface = pygame.Surface(size, pygame.SRCALPHA)
         surface.fill(color)
         
@@ -96,45 +143,109 @@ class AssetManager:
             except:
                 pass  # Ignore font errors
         
+        # Формат экрана, если он уже создан - blit без конвертации пикселей
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        
+        self.placeholders[key] = surface
         return surface
     
-    def get_player_sprite(self, state: str, size: Tuple[int, int] = (48, 72)) -> pygame.Surface:
+    def get_flipped_image(self, image: pygame.Surface) -> pygame.Surface:
+        """
+        Get horizontally mirrored copy of an image.
+        
+        The copy is created once and cached, so renderers can pick
+        the left-facing sprite without calling transform.flip every frame.
+        
+        Args:
+            image: Source surface
+            
+        Returns:
+            Mirrored surface
+        """
+        flipped = self.flipped_images.get(image)
+        if flipped is None:
+            flipped = pygame.transform.flip(image, True, False)
+            self.flipped_images[image] = flipped
+        return flipped
+    
+    def get_faded_image(self, image: pygame.Surface, alpha: int = 128) -> pygame.Surface:
+        """
+        Get semi-transparent copy of an image.
+        
+        The copy is created once per (surface, alpha) and shared by all
+        entities that draw this surface, e.g. for the damage blink effect.
+        
+        Args:
+            image: Source surface
+            alpha: Surface alpha of the copy (0-255)
+            
+        Returns:
+            Semi-transparent surface
+        """
+        key = (image, alpha)
+        faded = self.faded_images.get(key)
+        if faded is None:
+            faded = image.copy()
+            faded.set_alpha(alpha)
+            self.faded_images[key] = faded
+        return faded
+    
+    def _apply_facing(self, sprite: pygame.Surface, facing: str) -> pygame.Surface:
+        """Return sprite for facing direction ('R' - as is, 'L' - mirrored)."""
+        if facing == 'L':
+            return self.get_flipped_image(sprite)
+        return sprite
+    
+    def get_player_sprite(self, state: str, size: Tuple[int, int] = (48, 72),
+                          facing: str = 'R') -> pygame.Surface:
         """
         Get player sprite for given state.
         
         Args:
             state: Player state ('idle', 'walk', 'jump', 'fall', 'crouch')
             size: Size of sprite
+            facing: Facing direction ('R' or 'L')
             
         Returns:
             Player sprite surface
         """
-        # Map states to your actual file names (обновленные пути)
-        sprite_mapping = {
-            'idle': 'assets/player/player_static.png',
-            'walk': 'assets/player/player_walk/0.png',  # Default walk frame
-            'jump': 'assets/player/player_jump.png',
-            'fall': 'assets/player/player_jump.png',  # Use jump sprite for falling if no separate fall sprite
-            'crouch': 'assets/player/player_shift.png'
-        }
-        
-        sprite_path = sprite_mapping.get(state)
+        # Изображения кэшируются в load_image по (путь, размер), повторный вызов не декодирует файл
+        sprite_path = PLAYER_SPRITE_PATHS.get(state)
         if sprite_path:
             sprite = self.load_image(sprite_path, size)
             if sprite:
-                return sprite
+                return self._apply_facing(sprite, facing)
         
         # Create placeholder if file not found
         color = self.placeholder_colors.get(f'player_{state}', (100, 150, 255))
-        return self.create_placeholder(size, color, state.upper())
+        return self._apply_facing(self.create_placeholder(size, color, state.upper()), facing)
+    
+    def get_walk_animation_frame(self, frame_index: int, size: Tuple[int, int] = (48, 72),
+                                 facing: str = 'R') -> pygame.Surface:
+        """
+        Get walk animation frame by its position in the animation.
+        
+        Args:
+            frame_index: Frame index in the animation (wraps around)
+            size: Size of sprite
+            facing: Facing direction ('R' or 'L')
+            
+        Returns:
+            Walk animation frame (cached surface, same object on repeated calls)
+        """
+        frame_number = PLAYER_WALK_FRAME_NUMBERS[frame_index % len(PLAYER_WALK_FRAME_NUMBERS)]
+        return self.get_walk_animation_frame_by_number(frame_number, size, facing)
     
-    def get_walk_animation_frame_by_number(self, frame_number: int, size: Tuple[int, int] = (48, 72)) -> pygame.Surface:
+    def get_walk_animation_frame_by_number(self, frame_number: int, size: Tuple[int, int] = (48, 72),
+                                           facing: str = 'R') -> pygame.Surface:
         """
         Get specific walk animation frame by file number.
         
         Args:
             frame_number: Frame file number (0, 1, 2, 4, 5)
             size: Size of sprite
+            facing: Facing direction ('R' or 'L')
             
         Returns:
             Walk animation frame
@@ -143,18 +254,20 @@ class AssetManager:
         sprite = self.load_image(sprite_path, size)
         
         if sprite:
-            return sprite
+            return self._apply_facing(sprite, facing)
         
         # Fallback to idle sprite
-        return self.get_player_sprite('idle', size)
+        return self.get_player_sprite('idle', size, facing)
     
-    def get_wolf_sprite(self, state: str, size: Tuple[int, int] = (64, 48)) -> pygame.Surface:
+    def get_wolf_sprite(self, state: str, size: Tuple[int, int] = (64, 48),
+                        facing: str = 'R') -> pygame.Surface:
         """
         Get wolf sprite for given state.
         
         Args:
             state: Wolf state ('idle', 'walk', 'attack')
             size: Size of sprite
+            facing: Facing direction ('R' or 'L')
             
         Returns:
             Wolf sprite surface
@@ -169,19 +282,21 @@ class AssetManager:
         if sprite_path:
             sprite = self.load_image(sprite_path, size)
             if sprite:
-                return sprite
+                return self._apply_facing(sprite, facing)
         
         # Create placeholder if file not found
         color = (150, 100, 50)  # Brown for wolf
-        return self.create_placeholder(size, color, f"WOLF_{state.upper()}")
+        return self._apply_facing(self.create_placeholder(size, color, f"WOLF_{state.upper()}"), facing)
     
-    def get_wolf_walk_frame(self, frame_number: int, size: Tuple[int, int] = (64, 48)) -> pygame.Surface:
+    def get_wolf_walk_frame(self, frame_number: int, size: Tuple[int, int] = (64, 48),
+                            facing: str = 'R') -> pygame.Surface:
         """
         Get specific wolf walk animation frame.
         
         Args:
             frame_number: Frame file number (0, 1, 3, 4, 5, 6)
             size: Size of sprite
+            facing: Facing direction ('R' or 'L')
             
         Returns:
             Wolf walk animation frame
@@ -190,10 +305,10 @@ class AssetManager:
         sprite = self.load_image(sprite_path, size)
         
         if sprite:
-            return sprite
+            return self._apply_facing(sprite, facing)
         
         # Fallback to idle sprite
-        return self.get_wolf_sprite('idle', size)
+        return self.get_wolf_sprite('idle', size, facing)
     
     def get_bear_sprite(self, state: str, size: Tuple[int, int] = (80, 64)) -> pygame.Surface:
         """
@@ -222,6 +337,39 @@ class AssetManager:
         color = (100, 50, 25)  # Dark brown for bear
         return self.create_placeholder(size, color, f"BEAR_{state.upper()}")
     
+    def get_bear_sprites(self, size: Tuple[int, int] = (80, 64)) -> Dict[str, pygame.Surface]:
+        """
+        Get the full bear sprite set ('idle', 'walk', 'attack') for given size.
+        
+        The set is built once per size and shared by all bears.
+        
+        Args:
+            size: Size of sprites
+            
+        Returns:
+            New dict of state -> sprite (the surfaces themselves are shared)
+        """
+        cached = self.bear_sprite_sets.get(size)
+        if cached is not None:
+            return dict(cached)
+        
+        sprites = {
+            'idle': self.get_bear_sprite('idle', size),
+            'walk': self.get_bear_sprite('walk', size),
+            'attack': self.get_bear_sprite('attack', size)
+        }
+        
+        # Если нет отдельных спрайтов, используем базовые
+        if not sprites['walk']:
+            sprites['walk'] = sprites['idle']
+        if not sprites['attack']:
+            sprites['attack'] = sprites['idle']
+
+        # Набор ссылается на те же поверхности, что уже лежат в images/scaled_images,
+        # поэтому кэшируется так же безусловно
+        self.bear_sprite_sets[size] = sprites
+        return dict(sprites)
+    
     def get_balalaika_sprite(self, size: Tuple[int, int] = (48, 32)) -> pygame.Surface:
         """Get balalaika sprite."""
         sprite = self.load_image("assets/balalaika.png", size)
@@ -449,9 +597,14 @@ class AssetManager:
     def clear_cache(self) -> None:
         """Clear all cached assets."""
         self.images.clear()
+        self.scaled_images.clear()
         self.fonts.clear()
         self.loaded_themes.clear()
         self.sounds.clear()
+        self.flipped_images.clear()
+        self.faded_images.clear()
+        self.bear_sprite_sets.clear()
+        self.placeholders.clear()
         print("Asset cache cleared")
     
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
@@ -9,9 +9,20 @@ from game.physics import Vector2D
 from game.assets import asset_manager
 
 
+# Максимальная дальность полета (в квадрате - сравниваем без корня)
+MAX_TRAVEL_DISTANCE = 1000
+MAX_TRAVEL_DISTANCE_SQ = MAX_TRAVEL_DISTANCE * MAX_TRAVEL_DISTANCE
+
+
 class BalalaikaProjectile:
     """Снаряд балалайки медведя-босса."""
     
+    # Снарядов может быть много одновременно - без __dict__ на каждый
+    __slots__ = (
+        'start_pos', 'target_pos', 'position', 'velocity', 'speed', 'damage',
+        'passes_through_platforms', 'active', 'width', 'height', 'sprite',
+    )
+    
     def __init__(self, start_x: float, start_y: float, target_x: float, target_y: float):
         """
         Создает снаряд балалайки.
@@ -84,12 +95,10 @@ class BalalaikaProjectile:
         self.position.y += self.velocity.y * delta_time
         
         # Проверяем, не улетел ли слишком далеко
-        distance_from_start = math.sqrt(
-            (self.position.x - self.start_pos.x) ** 2 + 
-            (self.position.y - self.start_pos.y) ** 2
-        )
+        dx = self.position.x - self.start_pos.x
+        dy = self.position.y - self.start_pos.y
         
-        if distance_from_start > 1000:
+        if dx * dx + dy * dy > MAX_TRAVEL_DISTANCE_SQ:
             self.active = False
     
     def get_rect(self) -> pygame.Rect:
@@ -114,9 +123,12 @@ class BalalaikaProjectile:
         if not self.active:
             return False
         
-        balalaika_rect = self.get_rect()
+        # Те же целые края, что у get_rect(), но без создания Rect
+        left = int(self.position.x - self.width // 2)
+        top = int(self.position.y - self.height // 2)
         
-        if balalaika_rect.colliderect(player_rect):
+        if (left < player_rect.right and left + self.width > player_rect.left and
+                top < player_rect.bottom and top + self.height > player_rect.top):
             self.active = False
             return True
         
@@ -131,11 +143,14 @@ class BalalaikaProjectile:
             camera_offset = Vector2D(0, 0)
         
         # Рендерим
-        render_pos = (
+        surface.blit(self.sprite, self.get_render_pos(camera_offset))
+    
+    def get_render_pos(self, camera_offset: Vector2D) -> tuple:
+        """Возвращает экранную позицию левого верхнего угла спрайта."""
+        return (
             int(self.position.x - camera_offset.x - self.width // 2),
             int(self.position.y - camera_offset.y - self.height // 2)
         )
-        surface.blit(self.sprite, render_pos)
     
     @property
     def x(self) -> float:
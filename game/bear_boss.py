@@ -5,7 +5,6 @@ Bear Boss System
 
 import pygame
 import random
-import math
 from typing import Dict, Optional
 from game.physics import Vector2D
 from game.assets import asset_manager
@@ -64,21 +63,9 @@ class BearBoss:
         self.sprites = self._load_sprites()
     
     def _load_sprites(self) -> Dict[str, pygame.Surface]:
-        """Загружает все спрайты медведя."""
-        sprites = {}
-        
-        # Основные спрайты
-        sprites['idle'] = asset_manager.get_bear_sprite('idle', (int(self.size.x), int(self.size.y)))
-        sprites['walk'] = asset_manager.get_bear_sprite('walk', (int(self.size.x), int(self.size.y)))
-        sprites['attack'] = asset_manager.get_bear_sprite('attack', (int(self.size.x), int(self.size.y)))
-        
-        # Если нет отдельных спрайтов, используем базовые
-        if not sprites['walk']:
-            sprites['walk'] = sprites['idle']
-        if not sprites['attack']:
-            sprites['attack'] = sprites['idle']
-        
-        return sprites
+        """Загружает все спрайты медведя (набор общий для медведей одного размера)."""
+        sprite_size = (int(self.size.x), int(self.size.y))
+        return asset_manager.get_bear_sprites(sprite_size)
     
     def set_target(self, target):
         """Устанавливает цель для преследования."""
@@ -106,10 +93,10 @@ class BearBoss:
     def _update_ai(self, player_position: tuple):
         """Обновляет ИИ медведя."""
         player_x, player_y = player_position
-        distance_to_player = math.sqrt(
-            (player_x - self.position.x) ** 2 + 
-            (player_y - self.position.y) ** 2
-        )
+        # Сравниваем квадраты расстояний - корень не нужен
+        dx = player_x - self.position.x
+        dy = player_y - self.position.y
+        distance_sq = dx * dx + dy * dy
         
         # Определяем направление к игроку
         if player_x < self.position.x:
@@ -118,12 +105,12 @@ class BearBoss:
             self.facing_right = True
         
         # Логика состояний
-        if distance_to_player > self.chase_range:
+        if distance_sq > self.chase_range * self.chase_range:
             # Слишком далеко - стоим
             self.state = "idle"
             self.velocity.x = 0
             
-        elif distance_to_player <= self.attack_range:
+        elif distance_sq <= self.attack_range * self.attack_range:
             # Близко - атакуем
             if self.last_attack_time >= self.attack_cooldown:
                 self.state = "attack"
@@ -176,12 +163,7 @@ class BearBoss:
         """Выполняет ближнюю атаку."""
         if self.target and hasattr(self.target, 'take_damage'):
             # Проверяем, что игрок все еще в радиусе атаки
-            distance = math.sqrt(
-                (self.target.position.x - self.position.x) ** 2 + 
-                (self.target.position.y - self.position.y) ** 2
-            )
-            
-            if distance <= self.attack_range:
+            if self.position.distance_squared_to(self.target.position) <= self.attack_range * self.attack_range:
                 self.target.take_damage(self.damage_melee)
                 print("🐻 Медведь рычит и бьет лапой!")
                 self.last_attack_time = 0.0
@@ -47,6 +47,12 @@ class Collider:
     Collider component that can be attached to game objects.
     """
     
+    __slots__ = (
+        'physics_body', 'size', 'layer', 'is_trigger', 'enabled',
+        'on_collision_enter', 'on_collision_stay', 'on_collision_exit',
+        'current_collisions',
+    )
+    
     def __init__(self, physics_body: PhysicsBody, size: Vector2D, layer: int = CollisionLayer.PLATFORM, is_trigger: bool = False):
         self.physics_body = physics_body
         self.size = size
@@ -88,10 +94,6 @@ class CollisionSystem:
     def __init__(self):
         self.colliders: List[Collider] = []
         self.gravity = Vector2D(0, 980)  # Default gravity (pixels/second^2)
-        
-        # Spatial partitioning for optimization (simple grid)
-        self.grid_size = 100
-        self.spatial_grid = {}
     
     def add_collider(self, collider: Collider) -> None:
         """Add a collider to the system."""
@@ -103,53 +105,44 @@ class CollisionSystem:
         if collider in self.colliders:
             self.colliders.remove(collider)
     
-    def _get_grid_key(self, position: Vector2D) -> Tuple[int, int]:
-        """Get spatial grid key for a position."""
-        return (int(position.x // self.grid_size), int(position.y // self.grid_size))
-    
-    def _update_spatial_grid(self) -> None:
-        """Update spatial partitioning grid."""
-        self.spatial_grid.clear()
+    def _find_candidate_pairs(self) -> List[Tuple[Collider, Collider, pygame.Rect, pygame.Rect]]:
+        """
+        Broad phase: sweep-and-prune along the x axis.
         
-        for collider in self.colliders:
-            if not collider.enabled:
-                continue
-                
-            bounds = collider.get_bounds()
-            
-            # Add collider to all grid cells it overlaps
-            min_x = int(bounds.left // self.grid_size)
-            max_x = int(bounds.right // self.grid_size)
-            min_y = int(bounds.top // self.grid_size)
-            max_y = int(bounds.bottom // self.grid_size)
-            
-            for x in range(min_x, max_x + 1):
-                for y in range(min_y, max_y + 1):
-                    key = (x, y)
-                    if key not in self.spatial_grid:
-                        self.spatial_grid[key] = []
-                    self.spatial_grid[key].append(collider)
-    
-    def _get_potential_collisions(self, collider: Collider) -> List[Collider]:
-        """Get list of colliders that could potentially collide with the given collider."""
-        bounds = collider.get_bounds()
-        potential_colliders = set()
+        Bounds are computed once per collider. Colliders are sorted by left
+        edge and swept while keeping an active list of boxes whose x range
+        is still open, so only pairs overlapping on both axes are returned.
         
-        # Check all grid cells the collider overlaps
-        min_x = int(bounds.left // self.grid_size)
-        max_x = int(bounds.right // self.grid_size)
-        min_y = int(bounds.top // self.grid_size)
-        max_y = int(bounds.bottom // self.grid_size)
+        Returns:
+            List of (collider1, collider2, bounds1, bounds2) tuples, with the
+            lower id() first and ordered like the collider list
+        """
+        entries = []
+        for index, collider in enumerate(self.colliders):
+            if collider.enabled:
+                entries.append((collider.get_bounds(), index, collider))
+        entries.sort(key=lambda entry: entry[0].left)
         
-        for x in range(min_x, max_x + 1):
-            for y in range(min_y, max_y + 1):
-                key = (x, y)
-                if key in self.spatial_grid:
-                    potential_colliders.update(self.spatial_grid[key])
+        candidates = []
+        active = []
+        for entry in entries:
+            bounds = entry[0]
+            left = bounds.left
+            # Drop boxes that end before this one starts (touching is not overlap)
+            active = [other for other in active if other[0].right > left]
+            top = bounds.top
+            bottom = bounds.bottom
+            for other in active:
+                other_bounds = other[0]
+                if other_bounds.top < bottom and top < other_bounds.bottom:
+                    if id(entry[2]) < id(other[2]):
+                        candidates.append((entry[1], entry[2], other[2], bounds, other_bounds))
+                    else:
+                        candidates.append((other[1], other[2], entry[2], other_bounds, bounds))
+            active.append(entry)
         
-        # Remove self and disabled colliders
-        potential_colliders.discard(collider)
-        return [c for c in potential_colliders if c.enabled]
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [candidate[1:] for candidate in candidates]
     
     def check_collision(self, collider1: Collider, collider2: Collider) -> Optional[CollisionData]:
         """
@@ -202,36 +195,42 @@ class CollisionSystem:
         Args:
             delta_time: Time elapsed since last update
         """
-        # Update spatial grid
-        self._update_spatial_grid()
-        
-        # Apply gravity to all physics bodies (only if gravity_scale > 0)
-        for collider in self.colliders:
-            if collider.enabled and collider.physics_body.gravity_scale > 0:
-                collider.physics_body.apply_force(self.gravity * collider.physics_body.mass * collider.physics_body.gravity_scale)
-        
-        # Integrate physics for all bodies
+        # Apply gravity (only if gravity_scale > 0) and integrate in one pass;
+        # each body only touches its own state, so the order is unchanged
+        gravity = self.gravity
         for collider in self.colliders:
-            if collider.enabled:
-                collider.physics_body.integrate(delta_time, self.gravity)
+            if not collider.enabled:
+                continue
+            
+            body = collider.physics_body
+            if body.gravity_scale > 0:
+                # Same as apply_force(gravity * mass * gravity_scale): mass cancels out
+                acceleration = body.acceleration
+                acceleration.x += gravity.x * body.gravity_scale
+                acceleration.y += gravity.y * body.gravity_scale
+            else:
+                # Resting body without gravity (e.g. a platform): integrate
+                # would leave it unchanged, so skip it. Checked every frame
+                # instead of a sleeping flag, so direct velocity writes wake it
+                velocity = body.velocity
+                acceleration = body.acceleration
+                if not (velocity.x or velocity.y or acceleration.x or acceleration.y):
+                    continue
+            
+            body.integrate(delta_time, gravity)
         
-        # Detect and resolve collisions
+        # Detect and resolve collisions (narrow phase only for broad-phase candidates)
         collision_pairs = []
         
-        for collider in self.colliders:
-            if not collider.enabled:
+        for collider, other_collider, bounds, other_bounds in self._find_candidate_pairs():
+            if not CollisionLayer.can_collide(collider.layer, other_collider.layer):
                 continue
             
-            potential_colliders = self._get_potential_collisions(collider)
-            
-            for other_collider in potential_colliders:
-                # Avoid duplicate pairs
-                if id(collider) >= id(other_collider):
-                    continue
-                
-                collision = self.check_collision(collider, other_collider)
-                if collision:
-                    collision_pairs.append((collider, other_collider, collision))
+            collision = PhysicsUtils.aabb_collision_data(
+                bounds, other_bounds, collider.physics_body, other_collider.physics_body
+            )
+            if collision:
+                collision_pairs.append((collider, other_collider, collision))
         
         # Resolve all collisions
         for collider1, collider2, collision in collision_pairs:
@@ -268,26 +267,62 @@ class CollisionSystem:
         Returns:
             Tuple of (collider, hit_point, distance) if hit, None otherwise
         """
-        # Simple raycast implementation using step-by-step checking
-        step_size = 5.0  # Pixels per step
-        steps = int(max_distance / step_size)
+        # Slab test: one pass over the colliders, exact entry distance per box
+        start_x, start_y = start.x, start.y
+        dir_x, dir_y = direction.x, direction.y
         
-        for i in range(steps):
-            current_pos = start + direction * (i * step_size)
+        best_collider = None
+        best_distance = max_distance
+        
+        for collider in self.colliders:
+            if not collider.enabled:
+                continue
             
-            for collider in self.colliders:
-                if not collider.enabled:
+            if layer_mask is not None and not (collider.layer & layer_mask):
+                continue
+            
+            bounds = collider.get_bounds()
+            t_near = 0.0
+            t_far = best_distance
+            
+            # X slab (a ray parallel to the slab must start inside it)
+            if dir_x == 0:
+                if not bounds.left <= start_x < bounds.right:
+                    continue
+            else:
+                t1 = (bounds.left - start_x) / dir_x
+                t2 = (bounds.right - start_x) / dir_x
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                t_near = max(t_near, t1)
+                t_far = min(t_far, t2)
+                if t_near > t_far:
                     continue
-                
-                if layer_mask is not None and not (collider.layer & layer_mask):
+            
+            # Y slab
+            if dir_y == 0:
+                if not bounds.top <= start_y < bounds.bottom:
+                    continue
+            else:
+                t1 = (bounds.top - start_y) / dir_y
+                t2 = (bounds.bottom - start_y) / dir_y
+                if t1 > t2:
+                    t1, t2 = t2, t1
+                t_near = max(t_near, t1)
+                t_far = min(t_far, t2)
+                if t_near > t_far:
                     continue
-                
-                bounds = collider.get_bounds()
-                if bounds.collidepoint(current_pos.to_int_tuple()):
-                    distance = i * step_size
-                    return (collider, current_pos, distance)
+            
+            # Strictly closer hits only, so ties keep the first collider in the list
+            if best_collider is None or t_near < best_distance:
+                best_collider = collider
+                best_distance = t_near
+        
+        if best_collider is None:
+            return None
         
-        return None
+        hit_point = Vector2D(start_x + dir_x * best_distance, start_y + dir_y * best_distance)
+        return (best_collider, hit_point, best_distance)
     
     def get_colliders_in_area(self, area: pygame.Rect, layer_mask: int = None) -> List[Collider]:
         """
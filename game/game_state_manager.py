@@ -5,7 +5,7 @@ Centralized game state management following SOLID principles
 
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 import pygame
 from game.physics import Vector2D
 from game.utils import Colors, FontSizes, RenderUtils, GameConfig
@@ -59,6 +59,7 @@ class MenuState(IGameState):
     def __init__(self, window_width: int, window_height: int):
         self.window_width = window_width
         self.window_height = window_height
+        self.fonts: Optional[Tuple[pygame.font.Font, ...]] = None  # Created lazily on first render
         
     def enter(self, previous_state: Optional[GameState], data: Dict[str, Any] = None) -> None:
         """Enter menu state."""
@@ -77,9 +78,12 @@ class MenuState(IGameState):
         RenderUtils.draw_gradient_background(surface, Colors.MIDNIGHT_BLUE, Colors.DARK_BLUE, 
                                            self.window_width, self.window_height)
         
-        font_large = pygame.font.Font(None, FontSizes.EXTRA_LARGE)
-        font_medium = pygame.font.Font(None, FontSizes.LARGE)
-        font_small = pygame.font.Font(None, FontSizes.MEDIUM)
+        # Reuse the same fonts every frame so rendered text can be cached
+        if self.fonts is None:
+            self.fonts = (pygame.font.Font(None, FontSizes.EXTRA_LARGE),
+                          pygame.font.Font(None, FontSizes.LARGE),
+                          pygame.font.Font(None, FontSizes.MEDIUM))
+        font_large, font_medium, font_small = self.fonts
         
         # Title with shadow
         title_text = GameConfig.GAME_TITLE
@@ -189,16 +193,7 @@ class PlayingState(IGameState):
                     print(f"Player hit {len(hit_targets)} targets!")
         
         # Обновляем волков
-        for wolf in self.wolves[:]:  # Копируем список для безопасного удаления
-            if wolf.marked_for_removal:
-                self.wolves.remove(wolf)
-                continue
-            
-            # Применяем гравитацию к волку
-            self._apply_gravity_to_wolf(wolf, delta_time)
-            
-            # Обновляем волка
-            wolf.update(delta_time)
+        self._update_wolves(delta_time)
             
         # Простая проверка коллизий вместо сложной системы
         self._simple_collision_check()
@@ -309,13 +304,35 @@ class PlayingState(IGameState):
         # Интегрируем физику
         self.player.physics_body.integrate(delta_time, gravity)
     
-    def _apply_gravity_to_wolf(self, wolf: Wolf, delta_time: float) -> None:
+    def _update_wolves(self, delta_time: float) -> None:
+        """Обновляет всю стаю за один проход и убирает удаленных волков."""
+        # Один вектор гравитации на всю стаю вместо отдельного на каждого волка
+        gravity = Vector2D(0, 980)
+        
+        alive = []
+        for wolf in self.wolves:
+            if wolf.marked_for_removal:
+                continue
+            
+            # Применяем гравитацию к волку
+            self._apply_gravity_to_wolf(wolf, delta_time, gravity)
+            
+            # Обновляем волка
+            wolf.update(delta_time)
+            alive.append(wolf)
+        
+        # Без копии списка и remove() - одна сборка выживших
+        self.wolves[:] = alive
+    
+    def _apply_gravity_to_wolf(self, wolf: Wolf, delta_time: float,
+                               gravity: Optional[Vector2D] = None) -> None:
         """Применяет гравитацию к волку."""
         if not wolf:
             return
         
         # Гравитация: 980 пикселей/сек^2
-        gravity = Vector2D(0, 980)
+        if gravity is None:
+            gravity = Vector2D(0, 980)
         
         # Применяем гравитацию
         if wolf.physics_body.gravity_scale > 0:
@@ -475,18 +492,24 @@ class PlayingState(IGameState):
     
     def _render_platforms(self, surface: pygame.Surface) -> None:
         """Рендерит платформы."""
+        # Поднимаем обращения к атрибутам из цикла
+        draw_rect = pygame.draw.rect
+        border_color = Colors.BLACK
         for platform in self.platforms:
-            pygame.draw.rect(surface, platform['color'], platform['rect'])
+            rect = platform['rect']
+            draw_rect(surface, platform['color'], rect)
             # Рисуем границу
-            pygame.draw.rect(surface, Colors.BLACK, platform['rect'], 2)
+            draw_rect(surface, border_color, rect, 2)
         
         # Отладка: рисуем коллайдеры
         if GameConfig.SHOW_DEBUG_INFO:
             from game.collision import CollisionLayer
+            platform_layer = CollisionLayer.PLATFORM
+            debug_color = Colors.RED
             for collider in self.collision_system.colliders:
-                if collider.layer == CollisionLayer.PLATFORM:
+                if collider.layer == platform_layer:
                     bounds = collider.get_bounds()
-                    pygame.draw.rect(surface, Colors.RED, bounds, 2)
+                    draw_rect(surface, debug_color, bounds, 2)
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle playing state events."""
@@ -519,8 +542,9 @@ class PlayingState(IGameState):
         y_offset = 10
         
         # Player debug info
+        text_color = Colors.WHITE
         for key, value in self.player.debug_info.items():
-            text = font.render(f"{key}: {value}", True, Colors.WHITE)
+            text = font.render(f"{key}: {value}", True, text_color)
             panel_surface.blit(text, (10, y_offset))
             y_offset += 18
         
@@ -531,9 +555,10 @@ class PlayingState(IGameState):
             panel_surface.blit(text, (10, y_offset))
             y_offset += 18
             
+            text_color = Colors.LIGHT_GRAY
             for key, value in input_debug['keyboard'].items():
-                if key in ['horizontal', 'jump', 'crouch']:
-                    text = font.render(f"{key}: {value}", True, Colors.LIGHT_GRAY)
+                if key in ('horizontal', 'jump', 'crouch'):
+                    text = font.render(f"{key}: {value}", True, text_color)
                     panel_surface.blit(text, (10, y_offset))
                     y_offset += 18
         
@@ -17,6 +17,14 @@ class GameState(Enum):
     PAUSED = "paused"
 
 
+def _prescale(image: pygame.Surface, size: tuple) -> pygame.Surface:
+    """Масштабирует фон один раз и приводит к формату экрана для быстрого blit."""
+    scaled = pygame.transform.scale(image, size)
+    if pygame.display.get_surface() is not None:
+        scaled = scaled.convert()
+    return scaled
+
+
 class MenuScreen:
     """Экран главного меню."""
     
@@ -24,9 +32,15 @@ class MenuScreen:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.background = None
+        self.scaled_background = None  # Фон под размер экрана (строится при первом рендере)
         self.selected_option = 0
         self.menu_options = ["Start Game", "Exit"]
         
+        # Шрифты создаются один раз, а не в каждом кадре
+        self.title_font = pygame.font.Font(None, 72)
+        self.option_font = pygame.font.Font(None, 48)
+        self.instruction_font = pygame.font.Font(None, 24)
+        
         # Загружаем фон меню
         self._load_background()
     
@@ -38,7 +52,7 @@ class MenuScreen:
             self.background = pygame.Surface((self.screen_width, self.screen_height))
             self.background.fill((20, 30, 50))  # Темно-синий
     
-    def handle_input(self, keys_pressed: set, key_events: list) -> str:
+    def handle_input(self, key_events: list) -> str:
         """
         Обрабатывает ввод в меню.
         
@@ -63,29 +77,27 @@ class MenuScreen:
     
     def render(self, surface: pygame.Surface):
         """Рендерит меню."""
-        # Фон
+        # Фон (масштабируется один раз)
         if self.background:
-            bg_scaled = pygame.transform.scale(self.background, (self.screen_width, self.screen_height))
-            surface.blit(bg_scaled, (0, 0))
+            if self.scaled_background is None:
+                self.scaled_background = _prescale(self.background, (self.screen_width, self.screen_height))
+            surface.blit(self.scaled_background, (0, 0))
         
         # Заголовок
-        title_font = pygame.font.Font(None, 72)
-        title_text = title_font.render("Ingushetia Platformer", True, (255, 255, 255))
+        title_text = self.title_font.render("Ingushetia Platformer", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
         surface.blit(title_text, title_rect)
         
         # Опции меню
-        option_font = pygame.font.Font(None, 48)
         start_y = self.screen_height // 2
         
         for i, option in enumerate(self.menu_options):
             color = (255, 255, 0) if i == self.selected_option else (255, 255, 255)
-            option_text = option_font.render(option, True, color)
+            option_text = self.option_font.render(option, True, color)
             option_rect = option_text.get_rect(center=(self.screen_width // 2, start_y + i * 60))
             surface.blit(option_text, option_rect)
         
         # Инструкции
-        instruction_font = pygame.font.Font(None, 24)
         instructions = [
             "Use W/S or Arrow Keys to navigate",
             "Press ENTER or SPACE to select",
@@ -93,7 +105,7 @@ class MenuScreen:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, (200, 200, 200))
+            text = self.instruction_font.render(instruction, True, (200, 200, 200))
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height - 100 + i * 25))
             surface.blit(text, text_rect)
 
@@ -107,8 +119,13 @@ class DeathScreen:
         self.selected_option = 0
         self.death_options = ["Restart", "Main Menu", "Exit"]
         self.death_timer = 0.0
+        
+        # Шрифты создаются один раз, а не в каждом кадре
+        self.death_font = pygame.font.Font(None, 96)
+        self.option_font = pygame.font.Font(None, 48)
+        self.instruction_font = pygame.font.Font(None, 24)
     
-    def handle_input(self, keys_pressed: set, key_events: list) -> str:
+    def handle_input(self, key_events: list) -> str:
         """
         Обрабатывает ввод на экране смерти.
         
@@ -147,8 +164,7 @@ class DeathScreen:
         surface.blit(overlay, (0, 0))
         
         # Заголовок смерти
-        death_font = pygame.font.Font(None, 96)
-        death_text = death_font.render("YOU DIED", True, (255, 50, 50))
+        death_text = self.death_font.render("YOU DIED", True, (255, 50, 50))
         death_rect = death_text.get_rect(center=(self.screen_width // 2, self.screen_height // 3))
         surface.blit(death_text, death_rect)
         
@@ -157,17 +173,15 @@ class DeathScreen:
         death_text.set_alpha(alpha)
         
         # Опции
-        option_font = pygame.font.Font(None, 48)
         start_y = self.screen_height // 2 + 50
         
         for i, option in enumerate(self.death_options):
             color = (255, 255, 0) if i == self.selected_option else (255, 255, 255)
-            option_text = option_font.render(option, True, color)
+            option_text = self.option_font.render(option, True, color)
             option_rect = option_text.get_rect(center=(self.screen_width // 2, start_y + i * 60))
             surface.blit(option_text, option_rect)
         
         # Инструкции
-        instruction_font = pygame.font.Font(None, 24)
         instructions = [
             "Press R to restart quickly",
             "Use W/S to navigate, ENTER to select",
@@ -175,7 +189,7 @@ class DeathScreen:
         ]
         
         for i, instruction in enumerate(instructions):
-            text = instruction_font.render(instruction, True, (200, 200, 200))
+            text = self.instruction_font.render(instruction, True, (200, 200, 200))
             text_rect = text.get_rect(center=(self.screen_width // 2, self.screen_height - 80 + i * 25))
             surface.blit(text, text_rect)
 
@@ -187,6 +201,7 @@ class ParallaxBackground:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.parallax_image = None
+        self.scaled_image = None  # Параллакс под размер экрана (строится при первом рендере)
         self.parallax_x = 0.0
         self.parallax_speed = 0.3  # Скорость параллакса (30% от движения камеры)
         
@@ -218,8 +233,10 @@ class ParallaxBackground:
         if not self.parallax_image:
             return
         
-        # Масштабируем изображение под экран
-        scaled_image = pygame.transform.scale(self.parallax_image, (self.screen_width * 2, self.screen_height))
+        # Масштабируем изображение под экран (один раз)
+        if self.scaled_image is None:
+            self.scaled_image = _prescale(self.parallax_image, (self.screen_width * 2, self.screen_height))
+        scaled_image = self.scaled_image
         
         # Вычисляем позицию для бесшовного повтора
         image_width = scaled_image.get_width()
@@ -4,12 +4,12 @@ Handles player input and translates it to game actions
 """
 
 import pygame
-from typing import Dict, Set
+from typing import Dict, FrozenSet, Set
 from dataclasses import dataclass
 from game.player import Player
 
 
-@dataclass
+@dataclass(slots=True)
 class InputState:
     """Current input state."""
     horizontal: float = 0.0  # -1 to 1
@@ -29,22 +29,31 @@ class PlayerController:
     Supports both WASD and arrow key controls.
     """
     
+    __slots__ = (
+        'key_mappings',
+        'keys_pressed', 'keys_just_pressed', 'keys_just_released',
+        'mouse_buttons_pressed', 'mouse_buttons_just_pressed', 'mouse_buttons_just_released', 'mouse_pos',
+        'input_state',
+        'dead_zone', 'input_buffer_time', 'jump_buffer_timer',
+        'coyote_time', 'coyote_timer', 'was_grounded',
+    )
+    
     def __init__(self):
-        # Key mappings
-        self.key_mappings = {
+        # Key mappings (frozensets: O(1) membership, C-level isdisjoint)
+        self.key_mappings: Dict[str, FrozenSet[int]] = {
             # Movement
-            'move_left': [pygame.K_a, pygame.K_LEFT],
-            'move_right': [pygame.K_d, pygame.K_RIGHT],
-            'jump': [pygame.K_SPACE, pygame.K_w, pygame.K_UP],  # SPACE, W, and UP for jump
-            'crouch': [pygame.K_s, pygame.K_DOWN],
+            'move_left': frozenset((pygame.K_a, pygame.K_LEFT)),
+            'move_right': frozenset((pygame.K_d, pygame.K_RIGHT)),
+            'jump': frozenset((pygame.K_SPACE, pygame.K_w, pygame.K_UP)),  # SPACE, W, and UP for jump
+            'crouch': frozenset((pygame.K_s, pygame.K_DOWN)),
             
             # Combat
-            'attack': [],  # Будет обрабатываться через мышь
+            'attack': frozenset(),  # Будет обрабатываться через мышь
             
             # Actions
-            'action1': [pygame.K_j, pygame.K_z],
-            'action2': [pygame.K_k, pygame.K_x],
-            'pause': [pygame.K_ESCAPE, pygame.K_p]
+            'action1': frozenset((pygame.K_j, pygame.K_z)),
+            'action2': frozenset((pygame.K_k, pygame.K_x)),
+            'pause': frozenset((pygame.K_ESCAPE, pygame.K_p))
         }
         
         # Track key states
@@ -190,21 +199,24 @@ class PlayerController:
         if action not in self.key_mappings:
             return False
         
-        return any(key in self.keys_pressed for key in self.key_mappings[action])
+        # isdisjoint scans the action keys in C, no generator per call
+        return not self.keys_pressed.isdisjoint(self.key_mappings[action])
     
     def _is_key_just_pressed(self, action: str) -> bool:
         """Check if any key for the given action was just pressed this frame."""
         if action not in self.key_mappings:
             return False
         
-        return any(key in self.keys_just_pressed for key in self.key_mappings[action])
+        # isdisjoint scans the action keys in C, no generator per call
+        return not self.keys_just_pressed.isdisjoint(self.key_mappings[action])
     
     def _is_key_just_released(self, action: str) -> bool:
         """Check if any key for the given action was just released this frame."""
         if action not in self.key_mappings:
             return False
         
-        return any(key in self.keys_just_released for key in self.key_mappings[action])
+        # isdisjoint scans the action keys in C, no generator per call
+        return not self.keys_just_released.isdisjoint(self.key_mappings[action])
     
     def get_input_state(self) -> InputState:
         """Get current input state."""
@@ -218,7 +230,7 @@ class PlayerController:
             action: Action name
             keys: List of pygame key constants
         """
-        self.key_mappings[action] = keys
+        self.key_mappings[action] = frozenset(keys)
     
     def add_key_to_action(self, action: str, key: int) -> None:
         """
@@ -229,8 +241,7 @@ class PlayerController:
             key: Pygame key constant
         """
         if action in self.key_mappings:
-            if key not in self.key_mappings[action]:
-                self.key_mappings[action].append(key)
+            self.key_mappings[action] = self.key_mappings[action] | {key}
     
     def remove_key_from_action(self, action: str, key: int) -> None:
         """
@@ -240,8 +251,8 @@ class PlayerController:
             action: Action name
             key: Pygame key constant
         """
-        if action in self.key_mappings and key in self.key_mappings[action]:
-            self.key_mappings[action].remove(key)
+        if action in self.key_mappings:
+            self.key_mappings[action] = self.key_mappings[action] - {key}
     
     def get_debug_info(self) -> Dict[str, any]:
         """Get debug information about current input state."""
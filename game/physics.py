@@ -4,7 +4,7 @@ Mathematical and physics utilities for the Ingushetia 2D Platformer
 """
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple, Optional
 import pygame
 
@@ -14,6 +14,9 @@ class Vector2D:
     2D vector class with mathematical operations for physics calculations.
     """
     
+    # Vectors are created every frame: slots skip the per-instance dict
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float = 0.0, y: float = 0.0):
         self.x = x
         self.y = y
@@ -34,6 +37,39 @@ class Vector2D:
         """Reverse scalar multiplication."""
         return self.__mul__(scalar)
     
+    def __iadd__(self, other: 'Vector2D') -> 'Vector2D':
+        """In-place vector addition (no new object)."""
+        self.x += other.x
+        self.y += other.y
+        return self
+    
+    def __isub__(self, other: 'Vector2D') -> 'Vector2D':
+        """In-place vector subtraction (no new object)."""
+        self.x -= other.x
+        self.y -= other.y
+        return self
+    
+    def __imul__(self, scalar: float) -> 'Vector2D':
+        """In-place scalar multiplication (no new object)."""
+        self.x *= scalar
+        self.y *= scalar
+        return self
+    
+    def muladd(self, other: 'Vector2D', scalar: float) -> 'Vector2D':
+        """
+        In-place multiply-add: self += other * scalar.
+        
+        Args:
+            other: Vector to scale and add
+            scalar: Scale factor
+            
+        Returns:
+            self, so calls can be chained
+        """
+        self.x += other.x * scalar
+        self.y += other.y * scalar
+        return self
+    
     def __truediv__(self, scalar: float) -> 'Vector2D':
         """Scalar division."""
         if scalar == 0:
@@ -61,7 +97,7 @@ class Vector2D:
         Return normalized vector (unit vector in same direction).
         Returns zero vector if magnitude is zero.
         """
-        mag = self.magnitude()
+        mag = math.sqrt(self.x * self.x + self.y * self.y)
         if mag == 0:
             return Vector2D(0, 0)
         return Vector2D(self.x / mag, self.y / mag)
@@ -76,7 +112,15 @@ class Vector2D:
     
     def distance_to(self, other: 'Vector2D') -> float:
         """Calculate distance to another vector."""
-        return (self - other).magnitude()
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return math.sqrt(dx * dx + dy * dy)
+    
+    def distance_squared_to(self, other: 'Vector2D') -> float:
+        """Calculate squared distance to another vector (no sqrt, no allocation)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
     
     def lerp(self, other: 'Vector2D', t: float) -> 'Vector2D':
         """Linear interpolation between this vector and another."""
@@ -133,8 +177,8 @@ class PhysicsBody:
     Physics component for game objects with position, velocity, and physical properties.
     """
     position: Vector2D
-    velocity: Vector2D
-    acceleration: Vector2D
+    velocity: Vector2D = field(default_factory=Vector2D)  # Fresh zero vector per body
+    acceleration: Vector2D = field(default_factory=Vector2D)
     mass: float = 1.0
     friction: float = 0.8
     restitution: float = 0.0  # Bounciness (0 = no bounce, 1 = perfect bounce)
@@ -160,6 +204,19 @@ class PhysicsBody:
         """
         self.acceleration = self.acceleration + (force / self.mass)
     
+    def apply_force_xy(self, force_x: float, force_y: float) -> None:
+        """
+        Apply force given as components, updating acceleration in place.
+        
+        Same as apply_force, but without allocating temporary vectors.
+        
+        Args:
+            force_x: Force X component
+            force_y: Force Y component
+        """
+        self.acceleration.x += force_x / self.mass
+        self.acceleration.y += force_y / self.mass
+    
     def apply_impulse(self, impulse: Vector2D) -> None:
         """
         Apply instantaneous impulse to velocity.
@@ -177,26 +234,36 @@ class PhysicsBody:
             delta_time: Time step in seconds
             gravity: Gravity vector to apply
         """
+        # Work on scalar components: same arithmetic as the vector form,
+        # without allocating intermediate Vector2D objects
+        mass = self.mass
+        acceleration_x = self.acceleration.x
+        acceleration_y = self.acceleration.y
+        
         # Only apply gravity if gravity_scale > 0
         if gravity and self.gravity_scale > 0:
-            gravity_force = gravity * self.gravity_scale * self.mass
-            self.apply_force(gravity_force)
+            acceleration_x = acceleration_x + gravity.x * self.gravity_scale
+            acceleration_y = acceleration_y + gravity.y * self.gravity_scale
         
         # Apply drag
-        drag_force = self.velocity * (-self.drag * self.velocity.magnitude())
-        self.apply_force(drag_force)
-        
-        # Verlet integration
-        old_position = Vector2D(self.position.x, self.position.y)
+        velocity_x = self.velocity.x
+        velocity_y = self.velocity.y
+        drag_factor = -self.drag * math.sqrt(velocity_x * velocity_x + velocity_y * velocity_y)
+        acceleration_x = acceleration_x + velocity_x * drag_factor / mass
+        acceleration_y = acceleration_y + velocity_y * drag_factor / mass
         
-        # Update position: x = x + v*dt + 0.5*a*dt^2
-        self.position = self.position + self.velocity * delta_time + self.acceleration * (0.5 * delta_time * delta_time)
+        # Update position in place: x = x + v*dt + 0.5*a*dt^2
+        acceleration = self.acceleration
+        acceleration.x = acceleration_x
+        acceleration.y = acceleration_y
+        self.position.muladd(self.velocity, delta_time).muladd(acceleration, 0.5 * delta_time * delta_time)
         
-        # Update velocity: v = v + a*dt
-        self.velocity = self.velocity + self.acceleration * delta_time
+        # Update velocity in place: v = v + a*dt
+        self.velocity.muladd(acceleration, delta_time)
         
         # Reset acceleration for next frame
-        self.acceleration = Vector2D.zero()
+        acceleration.x = 0
+        acceleration.y = 0
     
     def get_bounds(self, size: Vector2D) -> pygame.Rect:
         """
@@ -229,7 +296,7 @@ class CollisionData:
     
     def __post_init__(self):
         """Ensure collision normal is normalized."""
-        if self.collision_normal.magnitude() > 0:
+        if self.collision_normal.magnitude_squared() > 0:
             self.collision_normal = self.collision_normal.normalize()
 
 
@@ -373,7 +440,7 @@ class PhysicsUtils:
         # Apply friction only if there's relative motion
         if body1.mass != float('inf') or body2.mass != float('inf'):
             tangent = relative_velocity - collision.collision_normal * velocity_along_normal
-            if tangent.magnitude() > 0.01:  # Avoid division by very small numbers
+            if tangent.magnitude_squared() > 0.0001:  # |tangent| > 0.01, avoid division by very small numbers
                 tangent = tangent.normalize()
                 
                 friction_impulse = tangent * impulse_scalar * min(body1.friction, body2.friction) * 0.1
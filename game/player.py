@@ -5,7 +5,7 @@ Player character implementation for the Ingushetia 2D Platformer
 
 import pygame
 import math
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from dataclasses import dataclass
 from game.physics import Vector2D, PhysicsBody
 from game.collision import Collider, CollisionLayer, CollisionData
@@ -118,6 +118,7 @@ class Player:
         self.animation_timer = 0.0
         self.current_frame = 0
         self.walk_frames = []  # Will store walk animation frames (0-4, using frames 0,1,2,4,5)
+        self.flipped_sprites = {}  # sprite -> mirrored copy, built once at load time
         self.walk_animation_speed = 8.0  # Frames per second
         
         # Load sprites
@@ -147,6 +148,12 @@ class Player:
             # Always add frame since get_walk_animation_frame_by_number always returns something
             self.walk_frames.append(frame)
         
+        # Mirror every sprite once so render never flips per frame
+        self.flipped_sprites = {
+            sprite: asset_manager.get_flipped_image(sprite)
+            for sprite in (*self.sprites.values(), *self.walk_frames)
+        }
+        
         # Set initial sprite
         self.current_sprite = self.sprites[PlayerState.FALLING]
         
@@ -188,7 +195,7 @@ class Player:
                 self.is_grounded = True
                 self.jump_count = 0
                 
-                if self.current_state in [PlayerState.FALLING, PlayerState.JUMPING]:
+                if self.current_state in (PlayerState.FALLING, PlayerState.JUMPING):
                     self._change_state(PlayerState.IDLE)
                     
                     # Stop downward velocity when landing
@@ -417,22 +424,26 @@ class Player:
         falling_threshold = 30   # Уменьшил с 50 до 30 для более быстрой реакции
         jumping_threshold = -30  # Увеличил с -50 до -30
         
+        # Read each attribute once; the branches below only compare locals
+        current_state = self.current_state
+        
         # State transitions
         if not self.is_grounded:
-            if self.physics_body.velocity.y < jumping_threshold:  # Going up fast
-                if self.current_state != PlayerState.JUMPING:
+            velocity_y = self.physics_body.velocity.y
+            if velocity_y < jumping_threshold:  # Going up fast
+                if current_state != PlayerState.JUMPING:
                     self._change_state(PlayerState.JUMPING)
-            elif self.physics_body.velocity.y > falling_threshold:  # Going down fast
-                if self.current_state != PlayerState.FALLING:
+            elif velocity_y > falling_threshold:  # Going down fast
+                if current_state != PlayerState.FALLING:
                     self._change_state(PlayerState.FALLING)
         else:
             # On ground - check for movement
-            if self.current_state not in [PlayerState.CROUCHING]:
-                if abs(self.input_horizontal) > 0.1:
-                    if self.current_state != PlayerState.WALKING:
+            if current_state != PlayerState.CROUCHING:
+                if not -0.1 <= self.input_horizontal <= 0.1:
+                    if current_state != PlayerState.WALKING:
                         self._change_state(PlayerState.WALKING)
                 else:
-                    if self.current_state != PlayerState.IDLE:
+                    if current_state != PlayerState.IDLE:
                         self._change_state(PlayerState.IDLE)
     
     def _apply_friction(self) -> None:
@@ -505,7 +516,7 @@ class Player:
             
             # Flip sprite horizontally if facing left
             if self.sprite_flip:
-                sprite = pygame.transform.flip(sprite, True, False)
+                sprite = self.flipped_sprites.get(sprite) or asset_manager.get_flipped_image(sprite)
             
             # Draw sprite
             surface.blit(sprite, sprite_rect)
@@ -597,6 +608,11 @@ class Player:
         """Get player world position."""
         return Vector2D(self.physics_body.position.x, self.physics_body.position.y)
     
+    def get_xy(self) -> Tuple[float, float]:
+        """Get player world position as an (x, y) tuple (no Vector2D copy)."""
+        position = self.physics_body.position
+        return position.x, position.y
+    
     def get_bounds(self) -> pygame.Rect:
         """Get player collision bounds."""
         return self.collider.get_bounds()
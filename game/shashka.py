@@ -8,9 +8,25 @@ from game.physics import Vector2D
 from game.assets import asset_manager
 
 
+# Границы мира для удаления шашек (мировые координаты с буфером)
+BUFFER_ZONE = 200
+WORLD_WIDTH = 2000
+SHASHKA_MIN_X = -BUFFER_ZONE
+SHASHKA_MAX_X = WORLD_WIDTH + BUFFER_ZONE
+
+# Общее нулевое смещение камеры (не изменять! разделяется всеми вызовами draw)
+_ZERO_OFFSET = Vector2D(0.0, 0.0)
+
+
 class ShashkaProjectile:
     """Снаряд шашки с линейным движением."""
     
+    # Фиксированный набор атрибутов: без __dict__ у каждого экземпляра
+    __slots__ = (
+        'position', 'speed', 'direction', 'velocity',
+        'damage', 'active', 'lifetime', 'width', 'height', 'sprite',
+    )
+    
     def __init__(self, start_x: float, start_y: float, direction: int):
         """
         Создает снаряд шашки.
@@ -39,6 +55,23 @@ class ShashkaProjectile:
         # Загружаем спрайт
         self.sprite = self._load_sprite()
     
+    def reset(self, start_x: float, start_y: float, direction: int):
+        """
+        Перезапускает снаряд для повторного использования (пул шашек игрока).
+        
+        Args:
+            start_x: Начальная позиция X
+            start_y: Начальная позиция Y
+            direction: Направление (1 = вправо, -1 = влево)
+        """
+        self.position.x = start_x
+        self.position.y = start_y
+        self.direction = direction
+        self.velocity.x = self.speed * direction
+        self.velocity.y = 0
+        self.active = True
+        self.lifetime = 0.0
+    
     def _load_sprite(self) -> pygame.Surface:
         """Загружает спрайт шашки."""
         sprite = asset_manager.get_weapon_sprite('shashka', (self.width, self.height))
@@ -75,20 +108,22 @@ class ShashkaProjectile:
             return
         
         if camera_offset is None:
-            camera_offset = Vector2D(0, 0)
-        
-        sprite = self.sprite
+            camera_offset = _ZERO_OFFSET
         
-        # Отражаем спрайт если летит влево
+        surface.blit(self.get_draw_sprite(), self.get_render_pos(camera_offset))
+    
+    def get_draw_sprite(self) -> pygame.Surface:
+        """Возвращает спрайт с учетом направления (отраженная копия кэшируется)."""
         if self.direction < 0:
-            sprite = pygame.transform.flip(sprite, True, False)
-        
-        # Рендерим
-        render_pos = (
+            return asset_manager.get_flipped_image(self.sprite)
+        return self.sprite
+    
+    def get_render_pos(self, camera_offset: Vector2D) -> tuple:
+        """Возвращает экранную позицию левого верхнего угла спрайта."""
+        return (
             int(self.position.x - camera_offset.x - self.width // 2),
             int(self.position.y - camera_offset.y - self.height // 2)
         )
-        surface.blit(sprite, render_pos)
     
     def get_rect(self) -> pygame.Rect:
         """Возвращает прямоугольник для коллизий."""
@@ -112,22 +147,22 @@ class ShashkaProjectile:
         if not self.active:
             return False
         
-        shashka_rect = self.get_rect()
-        
-        for platform in platforms:
-            if shashka_rect.colliderect(platform.rect if hasattr(platform, 'rect') else platform):
-                self.active = False
-                print(f"🌀 Шашка столкнулась: x={self.position.x:.1f}, y={self.position.y:.1f} с платформой")
-                return True
+        # collidelist перебирает платформы в C (принимает и Rect, и объекты с .rect)
+        if self.get_rect().collidelist(platforms) != -1:
+            self.active = False
+            print(f"🌀 Шашка столкнулась: x={self.position.x:.1f}, y={self.position.y:.1f} с платформой")
+            return True
         
         return False
     
-    def check_enemy_collision(self, enemies):
+    def check_enemy_collision(self, enemies, enemy_rects=None):
         """
         Проверяет столкновение с врагами.
         
         Args:
             enemies: Список врагов для проверки
+            enemy_rects: Прямоугольники врагов в том же порядке (посчитанные
+                один раз за кадр для всех шашек), необязательно
             
         Returns:
             Врага при попадании или None
@@ -137,6 +172,13 @@ class ShashkaProjectile:
         
         shashka_rect = self.get_rect()
         
+        if enemy_rects is not None:
+            index = shashka_rect.collidelist(enemy_rects)
+            if index == -1:
+                return None
+            self.active = False
+            return enemies[index]
+        
         for enemy in enemies:
             enemy_rect = enemy.get_rect() if hasattr(enemy, 'get_rect') else pygame.Rect(
                 int(enemy.position.x), int(enemy.position.y), 
@@ -3,11 +3,16 @@ Simple Player Module
 Simplified player for minimal working platformer
 """
 
+from __future__ import annotations
+
 import pygame
-from typing import Dict
 from game.physics import Vector2D
 from game.assets import asset_manager
-from game.shashka import ShashkaProjectile
+from game.shashka import ShashkaProjectile, SHASHKA_MIN_X, SHASHKA_MAX_X
+
+
+# Общее нулевое смещение камеры (не изменять! разделяется всеми вызовами render)
+_ZERO_OFFSET = Vector2D(0.0, 0.0)
 
 
 class SimplePlayer:
@@ -20,6 +25,8 @@ class SimplePlayer:
         self.position = Vector2D(start_position.x, start_position.y)
         self.velocity = Vector2D(0, 0)
         self.size = size
+        self._rect = pygame.Rect(0, 0, 0, 0)  # Переиспользуемый прямоугольник для get_rect()
+        self._foot_rect = pygame.Rect(0, 0, 0, 0)  # Переиспользуемый датчик земли для check_if_on_ground()
         
         # Физические параметры
         self.move_speed = 200.0
@@ -43,6 +50,9 @@ class SimplePlayer:
         self.SHASHKA_COOLDOWN = 0.5  # 500ms задержка
         self.MAX_SHASHKAS = 3        # макс 3 в полёте одновременно
         
+        # Пул снарядов: шашки создаются один раз и переиспользуются при бросках
+        self._shashka_pool = [ShashkaProjectile(0, 0, 1) for _ in range(self.MAX_SHASHKAS)]
+        
         # Система восстановления шашек
         self.shashka_count = 3       # Текущее количество доступных шашек
         self.shashka_regen_timer = 0.0  # Таймер восстановления
@@ -52,6 +62,7 @@ class SimplePlayer:
         self.animation_timer = 0.0
         self.animation_speed = 8.0  # кадров в секунду
         self.walk_frames = [0, 1, 2, 4, 5]  # доступные кадры ходьбы
+        self._walk_keys = {frame: f'walk_{frame}' for frame in self.walk_frames}  # ключи спрайтов
         self.current_frame = 0
         
         # Здоровье
@@ -64,22 +75,24 @@ class SimplePlayer:
         self.input_attack = False
         self.input_throw_shashka = False  # Новый ввод для метания шашки
         
-        # Загружаем спрайты
+        # Загружаем спрайты (обе ориентации заранее, без flip при рендере)
         self.sprites = self._load_sprites()
+        self.sprites_left = self._load_sprites('L')
     
-    def _load_sprites(self) -> Dict[str, pygame.Surface]:
-        """Загружает все спрайты игрока."""
+    def _load_sprites(self, facing: str = 'R') -> dict[str, pygame.Surface]:
+        """Загружает все спрайты игрока для заданного направления."""
         sprites = {}
+        size = (int(self.size.x), int(self.size.y))
         
         # Основные спрайты
-        sprites['idle'] = asset_manager.get_player_sprite('idle', (int(self.size.x), int(self.size.y)))
-        sprites['jump'] = asset_manager.get_player_sprite('jump', (int(self.size.x), int(self.size.y)))
-        sprites['crouch'] = asset_manager.get_player_sprite('crouch', (int(self.size.x), int(self.size.y)))
+        sprites['idle'] = asset_manager.get_player_sprite('idle', size, facing)
+        sprites['jump'] = asset_manager.get_player_sprite('jump', size, facing)
+        sprites['crouch'] = asset_manager.get_player_sprite('crouch', size, facing)
         
         # Кадры ходьбы
         for frame_num in self.walk_frames:
             sprites[f'walk_{frame_num}'] = asset_manager.get_walk_animation_frame_by_number(
-                frame_num, (int(self.size.x), int(self.size.y))
+                frame_num, size, facing
             )
         
         return sprites
@@ -93,32 +106,35 @@ class SimplePlayer:
     
     def update(self, delta_time: float):
         """Обновляет игрока."""
+        velocity = self.velocity
+        position = self.position
+        
         # Горизонтальное движение
         if self.input_horizontal != 0:
-            self.velocity.x = self.input_horizontal * self.move_speed
+            velocity.x = self.input_horizontal * self.move_speed
             # Обновляем направление ТОЛЬКО при активном движении
             self.facing_right = self.input_horizontal > 0
         else:
-            self.velocity.x *= self.friction
-            if abs(self.velocity.x) < 10:
-                self.velocity.x = 0
+            velocity.x *= self.friction
+            if -10 < velocity.x < 10:
+                velocity.x = 0
         
         # Прыжок
         if self.input_jump and self.is_grounded:
-            self.velocity.y = -self.jump_force
+            velocity.y = -self.jump_force
             self.is_grounded = False
         
         # Гравитация
         if not self.is_grounded:
-            self.velocity.y += self.gravity * delta_time
+            velocity.y += self.gravity * delta_time
         
         # Обновляем позицию
-        self.position.x += self.velocity.x * delta_time
-        self.position.y += self.velocity.y * delta_time
+        position.x += velocity.x * delta_time
+        position.y += velocity.y * delta_time
         
         # СТАБИЛИЗАЦИЯ СТОЯНИЯ (буфер для устранения дрожания)
-        if self.is_grounded and abs(self.velocity.y) < 0.5:
-            self.velocity.y = 0  # Обнуляем микро-скорость
+        if self.is_grounded and -0.5 < velocity.y < 0.5:
+            velocity.y = 0  # Обнуляем микро-скорость
             self.in_air_frames = 0  # Счётчик кадров в воздухе
         else:
             self.in_air_frames += 1
@@ -146,19 +162,17 @@ class SimplePlayer:
         """Проверяет, стоит ли игрок на какой-либо платформе."""
         player_rect = self.get_rect()
         
-        # Проверяем небольшую область под игроком
-        ground_check_rect = pygame.Rect(
+        # Проверяем небольшую область под игроком (прямоугольник переиспользуется)
+        ground_check_rect = self._foot_rect
+        ground_check_rect.update(
             player_rect.x + 5,  # Немного отступаем от краев
             player_rect.bottom,
             player_rect.width - 10,
             5  # Проверяем 5 пикселей вниз
         )
         
-        for platform in platforms:
-            if ground_check_rect.colliderect(platform):
-                return True
-        
-        return False
+        # collidelist перебирает прямоугольники в C
+        return ground_check_rect.collidelist(platforms) != -1
     
     def _handle_shashka_throwing(self):
         """Обрабатывает метание шашки."""
@@ -173,7 +187,8 @@ class SimplePlayer:
             start_y = player_rect.centery
             direction = 1 if self.facing_right else -1
             
-            new_shashka = ShashkaProjectile(start_x, start_y, direction)
+            new_shashka = self._acquire_shashka()
+            new_shashka.reset(start_x, start_y, direction)
             self.active_shashkas.append(new_shashka)
             self.shashka_cooldown = self.SHASHKA_COOLDOWN
             
@@ -182,6 +197,18 @@ class SimplePlayer:
             
             print(f"🗡️ Шашка брошена! Направление: {'→' if self.facing_right else '←'} (осталось: {self.shashka_count})")
     
+    def _acquire_shashka(self) -> ShashkaProjectile:
+        """Возвращает свободную шашку из пула (не находящуюся в полёте)."""
+        # Свободной считаем любую шашку пула, которой нет в active_shashkas -
+        # так пул корректен, даже если игра удаляет шашки из списка сама
+        active = self.active_shashkas
+        for shashka in self._shashka_pool:
+            if shashka not in active:
+                return shashka
+        
+        # Пул исчерпан (шашки добавлены в список извне) - создаем новую
+        return ShashkaProjectile(0, 0, 1)
+    
     def _update_shashka_regeneration(self, delta_time: float):
         """Обновляет систему восстановления шашек."""
         if self.shashka_count < self.MAX_SHASHKAS:
@@ -196,26 +223,53 @@ class SimplePlayer:
             self.shashka_regen_timer = 0.0
     
     def _update_shashkas(self, delta_time: float):
-        """Обновляет все активные шашки."""
-        for shashka in self.active_shashkas[:]:  # Копия списка
+        """Обновляет все активные шашки за один проход."""
+        alive = []
+        for shashka in self.active_shashkas:
             shashka.update(delta_time)
             
             # Удаляем неактивные шашки
             if not shashka.active:
-                self.active_shashkas.remove(shashka)
                 continue
             
             # Удаляем шашки за пределами мира с буфером
-            BUFFER_ZONE = 200
-            WORLD_WIDTH = 2000  # Размер игрового мира
-            if shashka.x < -BUFFER_ZONE or shashka.x > WORLD_WIDTH + BUFFER_ZONE:
-                self.active_shashkas.remove(shashka)
-                print(f"🌀 Шашка удалена в player: x={shashka.x:.1f}, причина: граница мира")
+            x = shashka.position.x
+            if x < SHASHKA_MIN_X or x > SHASHKA_MAX_X:
+                print(f"🌀 Шашка удалена в player: x={x:.1f}, причина: граница мира")
+                continue
+            
+            alive.append(shashka)
+        
+        # Сохраняем тот же объект списка - на него могут ссылаться снаружи
+        self.active_shashkas[:] = alive
     
-    def render_shashkas(self, surface: pygame.Surface, camera_offset: Vector2D = None):
-        """Рендерит все активные шашки."""
+    def render_shashkas(self, surface: pygame.Surface, camera_offset: Vector2D = None,
+                        view: pygame.Rect = None):
+        """
+        Рендерит все активные шашки.
+        
+        Args:
+            surface: Поверхность для рендера
+            camera_offset: Смещение камеры
+            view: Видимая область мира - шашки вне ее не рисуются
+        """
+        if camera_offset is None:
+            camera_offset = _ZERO_OFFSET
+        
+        # Собираем все шашки и рисуем одним вызовом blits
+        blit_sequence = []
         for shashka in self.active_shashkas:
-            shashka.draw(surface, camera_offset)
+            if not shashka.active:
+                continue
+            if view is not None:
+                x = shashka.position.x
+                half_width = shashka.width // 2
+                if x + half_width < view.left or x - half_width > view.right:
+                    continue
+            blit_sequence.append((shashka.get_draw_sprite(), shashka.get_render_pos(camera_offset)))
+        
+        if blit_sequence:
+            surface.blits(blit_sequence, False)
     
     def _update_state(self):
         """Определяет текущее состояние игрока на основе физики с буферной зоной."""
@@ -226,7 +280,7 @@ class SimplePlayer:
         if not effective_on_ground:
             self.current_state = "jumping"
         # 2. ХОДЬБА - движется горизонтально по земле (увеличен порог для учета трения)
-        elif abs(self.velocity.x) > 50.0:  # Увеличен с 0.1 до 50.0 для учета трения
+        elif not -50.0 <= self.velocity.x <= 50.0:  # Увеличен с 0.1 до 50.0 для учета трения
             self.current_state = "walking"
         # 3. IDLE - стоит стабильно на земле
         else:
@@ -243,58 +297,58 @@ class SimplePlayer:
             self.current_frame = 0
     
     def get_rect(self) -> pygame.Rect:
-        """Возвращает прямоугольник коллизии."""
-        return pygame.Rect(
-            int(self.position.x), 
-            int(self.position.y), 
-            int(self.size.x), 
-            int(self.size.y)
-        )
+        """
+        Возвращает прямоугольник коллизии.
+        
+        Прямоугольник один на игрока и обновляется на месте при каждом вызове
+        (без создания нового Rect). Чтобы сохранить его, используйте copy().
+        """
+        rect = self._rect
+        rect.update(int(self.position.x), int(self.position.y), int(self.size.x), int(self.size.y))
+        return rect
     
     def render(self, surface: pygame.Surface, camera_offset: Vector2D = None, debug_mode: bool = False):
         """Рендерит игрока."""
         if camera_offset is None:
-            camera_offset = Vector2D(0, 0)
+            camera_offset = _ZERO_OFFSET
+        
+        # Набор спрайтов в зависимости от направления (отражены заранее)
+        sprites = self.sprites if self.facing_right else self.sprites_left
         
         # Выбираем спрайт на основе состояния
         if self.current_state == "idle":
             # IDLE: ТОЛЬКО static.png когда стоит на месте
-            sprite = self.sprites['idle']
+            sprite = sprites['idle']
         elif self.current_state == "walking":
             # ХОДЬБА: анимация walk/*.png ТОЛЬКО при движении по земле
-            sprite_key = f'walk_{self.current_frame}'
-            sprite = self.sprites.get(sprite_key, self.sprites['idle'])
+            sprite = sprites.get(self._walk_keys.get(self.current_frame), sprites['idle'])
         elif self.current_state == "jumping":
             # ПРЫЖОК/ПАДЕНИЕ: ТОЛЬКО jump.png при любом вертикальном движении или в воздухе
-            sprite = self.sprites['jump']
+            sprite = sprites['jump']
         else:
             # Fallback
-            sprite = self.sprites['idle']
+            sprite = sprites['idle']
         
-        # Отражаем спрайт в зависимости от направления (сохраняем ориентацию)
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
+        # Экранные координаты считаем один раз на кадр
+        screen_x = self.position.x - camera_offset.x
+        screen_y = self.position.y - camera_offset.y
         
         # Рендерим
-        render_pos = (
-            int(self.position.x - camera_offset.x),
-            int(self.position.y - camera_offset.y)
-        )
-        surface.blit(sprite, render_pos)
+        surface.blit(sprite, (int(screen_x), int(screen_y)))
         
         # Рендерим полоску здоровья
-        self._render_health_bar(surface, camera_offset)
+        self._render_health_bar(surface, screen_x, screen_y)
         
         # ВИЗУАЛЬНАЯ ОТЛАДКА стабилизации анимации
         if debug_mode:
             self._render_stability_debug(surface, camera_offset)
     
-    def _render_health_bar(self, surface: pygame.Surface, camera_offset: Vector2D):
-        """Рендерит полоску здоровья."""
+    def _render_health_bar(self, surface: pygame.Surface, screen_x: float, screen_y: float):
+        """Рендерит полоску здоровья по экранной позиции игрока."""
         bar_width = 60
         bar_height = 8
-        bar_x = int(self.position.x - camera_offset.x + (self.size.x - bar_width) / 2)
-        bar_y = int(self.position.y - camera_offset.y - 15)
+        bar_x = int(screen_x + (self.size.x - bar_width) / 2)
+        bar_y = int(screen_y - 15)
         
         # Фон полоски
         bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
@@ -360,17 +414,45 @@ class SimplePlayer:
         """Лечит игрока."""
         self.health = min(self.max_health, self.health + amount)
     
+    def check_platform_collisions(self, platform_rects):
+        """
+        Разрешает коллизии со списком платформ.
+        
+        Поиск пересечений идет в C (Rect.collidelist), в Python разбираются
+        только платформы, которых игрок касается. Порядок и результат такие
+        же, как у вызова check_platform_collision для каждой платформы.
+        
+        Args:
+            platform_rects: Прямоугольники платформ (или объекты с .rect)
+        """
+        start = 0
+        count = len(platform_rects)
+        while start < count:
+            # Позиция могла сдвинуться после предыдущей платформы - ищем заново
+            index = self.get_rect().collidelist(platform_rects[start:])
+            if index == -1:
+                return
+            platform = platform_rects[start + index]
+            self.check_platform_collision(getattr(platform, 'rect', platform))
+            start += index + 1
+    
     def check_platform_collision(self, platform_rect: pygame.Rect):
         """Проверяет коллизию с платформой с улучшенной стабилизацией."""
-        player_rect = self.get_rect()
-        
-        if player_rect.colliderect(platform_rect):
-            # Определяем сторону коллизии
-            overlap_left = player_rect.right - platform_rect.left
-            overlap_right = platform_rect.right - player_rect.left
-            overlap_top = player_rect.bottom - platform_rect.top
-            overlap_bottom = platform_rect.bottom - player_rect.top
-            
+        # Края игрока считаем напрямую, без создания pygame.Rect
+        left = int(self.position.x)
+        top = int(self.position.y)
+        right = left + int(self.size.x)
+        bottom = top + int(self.size.y)
+        
+        # Перекрытия по сторонам (все > 0 <=> colliderect)
+        overlap_left = right - platform_rect.left
+        overlap_right = platform_rect.right - left
+        overlap_top = bottom - platform_rect.top
+        overlap_bottom = platform_rect.bottom - top
+        
+        if overlap_left > 0 and overlap_right > 0 and overlap_top > 0 and overlap_bottom > 0:
+            # Определяем сторону коллизии: каждая сторона с минимальным перекрытием
+            # проверяет свое условие скорости, иначе пробуем следующую
             min_overlap = min(overlap_left, overlap_right, overlap_top, overlap_bottom)
             
             if min_overlap == overlap_top and self.velocity.y >= 0:
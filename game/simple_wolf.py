@@ -3,16 +3,33 @@ Simple Wolf Enemy Module
 Simplified wolf enemy for minimal working platformer
 """
 
+from __future__ import annotations
+
 import pygame
 import math
-from typing import Dict
 from game.physics import Vector2D
 from game.assets import asset_manager
 
 
+# Общее нулевое смещение камеры (не изменять! разделяется всеми вызовами render)
+_ZERO_OFFSET = Vector2D(0.0, 0.0)
+
+
 class SimpleWolf:
     """Простой враг-волк с базовым ИИ."""
     
+    # Фиксированный набор атрибутов: без __dict__ у каждого экземпляра
+    __slots__ = (
+        'position', 'velocity', 'size', 'gravity', 'friction', 'is_grounded',
+        'health', 'max_health', 'is_dead',
+        'current_state', 'facing_right', 'move_speed',
+        'patrol_start', 'patrol_range', 'patrol_direction',
+        'target', 'detection_range', 'attack_range', 'attack_damage',
+        'attack_cooldown', 'last_attack_time', 'attack_sound',
+        'sprites', 'sprites_left', 'walk_frames', 'current_frame',
+        'animation_timer', 'animation_speed',
+    )
+    
     def __init__(self, start_position: Vector2D, size: Vector2D = None):
         if size is None:
             size = Vector2D(64, 48)
@@ -57,24 +74,26 @@ class SimpleWolf:
         # Цель
         self.target = None
         
-        # Загружаем спрайты
+        # Загружаем спрайты (обе ориентации заранее, без flip при рендере)
         self.sprites = self._load_sprites()
+        self.sprites_left = self._load_sprites('L')
         
         # Загружаем звук атаки
         self.attack_sound = asset_manager.get_wolf_sound()
     
-    def _load_sprites(self) -> Dict[str, pygame.Surface]:
-        """Загружает все спрайты волка."""
+    def _load_sprites(self, facing: str = 'R') -> dict[str, pygame.Surface]:
+        """Загружает все спрайты волка для заданного направления."""
         sprites = {}
+        size = (int(self.size.x), int(self.size.y))
         
         # Основные спрайты
-        sprites['idle'] = asset_manager.get_wolf_sprite('idle', (int(self.size.x), int(self.size.y)))
-        sprites['attack'] = asset_manager.get_wolf_sprite('attack', (int(self.size.x), int(self.size.y)))
+        sprites['idle'] = asset_manager.get_wolf_sprite('idle', size, facing)
+        sprites['attack'] = asset_manager.get_wolf_sprite('attack', size, facing)
         
         # Кадры ходьбы
         for frame_num in self.walk_frames:
             sprites[f'walk_{frame_num}'] = asset_manager.get_wolf_walk_frame(
-                frame_num, (int(self.size.x), int(self.size.y))
+                frame_num, size, facing
             )
         
         return sprites
@@ -92,13 +111,15 @@ class SimpleWolf:
         
         # ИИ логика
         if self.target:
-            distance_to_target = abs(self.target.position.x - self.position.x)
+            # Расстояние считаем один раз за кадр и передаем дальше
+            dx = self.target.position.x - self.position.x
+            distance_to_target = -dx if dx < 0 else dx
             
             if distance_to_target <= self.detection_range:
                 # Преследуем цель
                 if distance_to_target <= self.attack_range:
                     # Атакуем
-                    self._attack_target(delta_time)
+                    self._attack_target(delta_time, distance_to_target)
                 else:
                     # Движемся к цели
                     self._move_towards_target()
@@ -146,20 +167,24 @@ class SimpleWolf:
         self.facing_right = self.velocity.x < 0  # Инвертировано!
         self.current_state = "walking"
     
-    def _attack_target(self, delta_time: float):
-        """Атакует цель."""
+    def _attack_target(self, delta_time: float, distance: float):
+        """
+        Атакует цель.
+        
+        Args:
+            delta_time: Время кадра
+            distance: Горизонтальное расстояние до цели (уже посчитано в update)
+        """
         self.velocity.x = 0
         self.current_state = "attacking"
         
         if self.last_attack_time >= self.attack_cooldown:
             if self.target and hasattr(self.target, 'take_damage'):
-                # Проверяем, что цель все еще в радиусе атаки
-                distance = abs(self.target.position.x - self.position.x)
-                
                 # Проверяем вертикальное расположение (не кусать сверху)
                 wolf_center_y = self.position.y + self.size.y / 2
                 target_center_y = self.target.position.y + self.target.size.y / 2
-                vertical_distance = abs(wolf_center_y - target_center_y)
+                dy = wolf_center_y - target_center_y
+                vertical_distance = -dy if dy < 0 else dy
                 
                 # Проверяем, не находится ли игрок сверху волка
                 target_bottom = self.target.position.y + self.target.size.y
@@ -209,41 +234,40 @@ class SimpleWolf:
             return
         
         if camera_offset is None:
-            camera_offset = Vector2D(0, 0)
+            camera_offset = _ZERO_OFFSET
+        
+        # Набор спрайтов в зависимости от направления (отражены заранее)
+        sprites = self.sprites if self.facing_right else self.sprites_left
         
         # Выбираем спрайт на основе состояния
         if self.current_state == "walking":
             # Анимация ходьбы для движения и патрулирования
             sprite_key = f'walk_{self.current_frame}'
-            sprite = self.sprites.get(sprite_key, self.sprites['idle'])
+            sprite = sprites.get(sprite_key, sprites['idle'])
         elif self.current_state == "attacking":
             # Для атаки используем статичный спрайт (или отдельную текстуру если есть)
-            sprite = self.sprites['attack']
+            sprite = sprites['attack']
         else:
             # Idle - используем анимацию ходьбы (волки всегда в движении)
             sprite_key = f'walk_{self.current_frame}'
-            sprite = self.sprites.get(sprite_key, self.sprites['idle'])
+            sprite = sprites.get(sprite_key, sprites['idle'])
         
-        # Отражаем спрайт в зависимости от направления движения
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
+        # Экранные координаты считаем один раз на кадр
+        screen_x = self.position.x - camera_offset.x
+        screen_y = self.position.y - camera_offset.y
         
         # Рендерим
-        render_pos = (
-            int(self.position.x - camera_offset.x),
-            int(self.position.y - camera_offset.y)
-        )
-        surface.blit(sprite, render_pos)
+        surface.blit(sprite, (int(screen_x), int(screen_y)))
         
         # Рендерим полоску здоровья
-        self._render_health_bar(surface, camera_offset)
+        self._render_health_bar(surface, screen_x, screen_y)
     
-    def _render_health_bar(self, surface: pygame.Surface, camera_offset: Vector2D):
-        """Рендерит полоску здоровья."""
+    def _render_health_bar(self, surface: pygame.Surface, screen_x: float, screen_y: float):
+        """Рендерит полоску здоровья по экранной позиции волка."""
         bar_width = 50
         bar_height = 6
-        bar_x = int(self.position.x - camera_offset.x + (self.size.x - bar_width) / 2)
-        bar_y = int(self.position.y - camera_offset.y - 12)
+        bar_x = int(screen_x + (self.size.x - bar_width) / 2)
+        bar_y = int(screen_y - 12)
         
         # Фон полоски
         bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
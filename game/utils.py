@@ -4,10 +4,20 @@ Following DRY principle and providing reusable components
 """
 
 import pygame
-from typing import Tuple, List
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Tuple, Deque
 from enum import Enum
 
 
+# Pre-rendered gradient surfaces keyed by (width, height, color1, color2)
+_GRADIENT_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_GRADIENT_CACHE_SIZE = 8
+
+# Pre-rendered star layers keyed by (width, height, count, seed)
+_STARS_CACHE: dict = {}
+
+
 class Colors:
     """Color constants for consistent theming."""
     
@@ -40,6 +50,13 @@ class FontSizes:
     EXTRA_LARGE = 64
 
 
+@lru_cache(maxsize=512)
+def _render_text_cached(font: pygame.font.Font, text: str,
+                        color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text once per (font, text, color)."""
+    return font.render(text, True, color)
+
+
 class RenderUtils:
     """Utility functions for rendering."""
     
@@ -56,14 +73,42 @@ class RenderUtils:
             width: Width of gradient
             height: Height of gradient
         """
+        if width <= 0 or height <= 0:
+            return
+        
+        key = (width, height, tuple(color1), tuple(color2))
+        gradient = _GRADIENT_CACHE.get(key)
+        if gradient is None:
+            gradient = RenderUtils._render_gradient(color1, color2, width, height)
+            _GRADIENT_CACHE[key] = gradient
+            if len(_GRADIENT_CACHE) > _GRADIENT_CACHE_SIZE:
+                _GRADIENT_CACHE.popitem(last=False)
+        else:
+            _GRADIENT_CACHE.move_to_end(key)
+        
+        surface.blit(gradient, (0, 0))
+    
+    @staticmethod
+    def _render_gradient(color1: Tuple[int, int, int], color2: Tuple[int, int, int],
+                         width: int, height: int) -> pygame.Surface:
+        """Render a vertical gradient onto a new surface."""
+        # Build a 1-pixel-wide column and let SDL stretch it to full width,
+        # instead of building a width x height buffer in Python
+        column = bytearray()
         for y in range(height):
             ratio = y / height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            
-            color = (r, g, b)
-            pygame.draw.line(surface, color, (0, y), (width, y))
+            column.append(int(color1[0] * (1 - ratio) + color2[0] * ratio))
+            column.append(int(color1[1] * (1 - ratio) + color2[1] * ratio))
+            column.append(int(color1[2] * (1 - ratio) + color2[2] * ratio))
+        
+        strip = pygame.image.frombuffer(bytes(column), (1, height), "RGB")
+        gradient = pygame.transform.scale(strip, (width, height))
+        
+        # The cached gradient is blitted every frame: store it in the display
+        # pixel format so that blit is a straight copy, not a 24->32 bit conversion
+        if pygame.display.get_surface() is not None:
+            gradient = gradient.convert()
+        return gradient
     
     @staticmethod
     def create_panel(width: int, height: int, background_color: Tuple[int, int, int], 
@@ -108,16 +153,21 @@ class RenderUtils:
             shadow_offset: Shadow offset (x, y)
         """
         # Draw shadow
-        shadow_surface = font.render(text, True, shadow_color)
+        shadow_surface = _render_text_cached(font, text, tuple(shadow_color))
         shadow_rect = shadow_surface.get_rect(center=(position[0] + shadow_offset[0], 
                                                      position[1] + shadow_offset[1]))
         surface.blit(shadow_surface, shadow_rect)
         
         # Draw text
-        text_surface = font.render(text, True, text_color)
+        text_surface = _render_text_cached(font, text, tuple(text_color))
         text_rect = text_surface.get_rect(center=position)
         surface.blit(text_surface, text_rect)
     
+    @staticmethod
+    def clear_text_cache() -> None:
+        """Drop cached text surfaces (call after fonts are reloaded)."""
+        _render_text_cached.cache_clear()
+    
     @staticmethod
     def draw_stars(surface: pygame.Surface, width: int, height: int, count: int = 50, 
                   seed: int = 42) -> None:
@@ -131,36 +181,59 @@ class RenderUtils:
             count: Number of stars
             seed: Random seed for consistent placement
         """
-        import random
-        random.seed(seed)
+        key = (width, height, count, seed)
+        stars = _STARS_CACHE.get(key)
+        if stars is None:
+            import random
+            rng = random.Random(seed)
+            
+            # Placement is deterministic per key, so draw the stars once
+            # onto a layer and just blit it afterwards
+            stars = pygame.Surface((width, height))
+            stars.fill(Colors.BLACK)
+            for _ in range(count):
+                x = rng.randint(0, width)
+                y = rng.randint(0, height // 2)
+                size = rng.randint(1, 3)
+                brightness = rng.randint(100, 255)
+                color = (brightness, brightness, brightness)
+                pygame.draw.circle(stars, color, (x, y), size)
+            
+            # Stars are opaque and never black, so a run-length encoded colorkey
+            # copies only the star pixels instead of alpha-blending the whole layer
+            stars.set_colorkey(Colors.BLACK, pygame.RLEACCEL)
+            _STARS_CACHE[key] = stars
         
-        for _ in range(count):
-            x = random.randint(0, width)
-            y = random.randint(0, height // 2)
-            size = random.randint(1, 3)
-            brightness = random.randint(100, 255)
-            color = (brightness, brightness, brightness)
-            pygame.draw.circle(surface, color, (x, y), size)
+        surface.blit(stars, (0, 0))
+
+
+def clamp(value: float, min_value: float, max_value: float) -> float:
+    """Clamp value between min and max."""
+    # Plain comparisons instead of max(min(...)): no extra call frames
+    if value > max_value:
+        value = max_value
+    if value < min_value:
+        return min_value
+    return value
+
+
+def lerp(start: float, end: float, t: float) -> float:
+    """Linear interpolation between start and end."""
+    return start + (end - start) * t
+
+
+def map_range(value: float, from_min: float, from_max: float,
+              to_min: float, to_max: float) -> float:
+    """Map value from one range to another."""
+    return (value - from_min) * (to_max - to_min) / (from_max - from_min) + to_min
 
 
 class MathUtils:
-    """Mathematical utility functions."""
-    
-    @staticmethod
-    def clamp(value: float, min_value: float, max_value: float) -> float:
-        """Clamp value between min and max."""
-        return max(min_value, min(value, max_value))
-    
-    @staticmethod
-    def lerp(start: float, end: float, t: float) -> float:
-        """Linear interpolation between start and end."""
-        return start + (end - start) * t
+    """Mathematical utility functions (kept for compatibility, see module-level versions)."""
     
-    @staticmethod
-    def map_range(value: float, from_min: float, from_max: float, 
-                 to_min: float, to_max: float) -> float:
-        """Map value from one range to another."""
-        return (value - from_min) * (to_max - to_min) / (from_max - from_min) + to_min
+    clamp = staticmethod(clamp)
+    lerp = staticmethod(lerp)
+    map_range = staticmethod(map_range)
 
 
 class PerformanceMonitor:
@@ -170,8 +243,9 @@ class PerformanceMonitor:
         self.frame_count = 0
         self.fps_timer = 0.0
         self.current_fps = 0.0
-        self.delta_times: List[float] = []
         self.max_delta_history = 60  # Keep last 60 frames
+        self.delta_times: Deque[float] = deque(maxlen=self.max_delta_history)
+        self._delta_sum = 0.0  # Running sum of delta_times
     
     def update(self, delta_time: float) -> None:
         """Update performance metrics."""
@@ -179,9 +253,11 @@ class PerformanceMonitor:
         self.fps_timer += delta_time
         
         # Track delta times
+        # deque drops the oldest sample itself; keep the running sum in step
+        if len(self.delta_times) == self.delta_times.maxlen:
+            self._delta_sum -= self.delta_times[0]
         self.delta_times.append(delta_time)
-        if len(self.delta_times) > self.max_delta_history:
-            self.delta_times.pop(0)
+        self._delta_sum += delta_time
         
         # Update FPS every second
         if self.fps_timer >= 1.0:
@@ -197,7 +273,7 @@ class PerformanceMonitor:
         """Get average delta time over recent frames."""
         if not self.delta_times:
             return 0.0
-        return sum(self.delta_times) / len(self.delta_times)
+        return self._delta_sum / len(self.delta_times)
     
     def get_frame_time_ms(self) -> float:
         """Get current frame time in milliseconds."""
@@ -210,9 +286,15 @@ class InputHelper:
     """Helper functions for input handling."""
     
     @staticmethod
-    def get_horizontal_input() -> float:
-        """Get horizontal input from keyboard (-1 to 1)."""
-        keys = pygame.key.get_pressed()
+    def get_horizontal_input(keys=None) -> float:
+        """
+        Get horizontal input from keyboard (-1 to 1).
+        
+        Args:
+            keys: Result of pygame.key.get_pressed() for this frame (polled if None)
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
         horizontal = 0.0
         
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
@@ -223,15 +305,27 @@ class InputHelper:
         return horizontal
     
     @staticmethod
-    def get_jump_input() -> bool:
-        """Get jump input from keyboard."""
-        keys = pygame.key.get_pressed()
+    def get_jump_input(keys=None) -> bool:
+        """
+        Get jump input from keyboard.
+        
+        Args:
+            keys: Result of pygame.key.get_pressed() for this frame (polled if None)
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
         return keys[pygame.K_SPACE] or keys[pygame.K_w] or keys[pygame.K_UP]
     
     @staticmethod
-    def get_crouch_input() -> bool:
-        """Get crouch input from keyboard."""
-        keys = pygame.key.get_pressed()
+    def get_crouch_input(keys=None) -> bool:
+        """
+        Get crouch input from keyboard.
+        
+        Args:
+            keys: Result of pygame.key.get_pressed() for this frame (polled if None)
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
         return keys[pygame.K_s] or keys[pygame.K_DOWN]
 
 
@@ -5,11 +5,12 @@ Wolf Enemy Module
 
 import pygame
 import math
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from game.physics import Vector2D, PhysicsBody
 from game.collision import Collider, CollisionLayer
 from game.health import HealthComponent, HealthBar
 from game.assets import asset_manager
+from game.utils import GameConfig
 
 
 class WolfState:
@@ -24,6 +25,22 @@ class WolfState:
 class Wolf:
     """Класс врага-волка."""
     
+    # Фиксированный набор атрибутов: без __dict__ у каждого экземпляра
+    __slots__ = (
+        'size', 'physics_body', 'collider', 'health', 'health_bar',
+        'current_state', 'facing_right',
+        'move_speed', 'horizontal_damping', 'attack_range', 'detection_range',
+        'attack_range_sq', 'detection_range_sq', 'attack_damage',
+        'attack_cooldown', 'last_attack_time', 'target', 'target_last_seen_pos',
+        'sprites', 'flipped_sprites', 'current_sprite', 'sprite_flip',
+        'animation_timer', 'walk_frames', 'walk_animation_speed',
+        'debug_info', 'is_grounded', 'marked_for_removal', '_needs_flip',
+        '_sprite_rect',
+    )
+    
+    # Общие заглушки по размеру спрайта (не изменяются, поэтому их можно разделять)
+    _FALLBACK_SPRITES: Dict[Tuple[int, int], pygame.Surface] = {}
+    
     def __init__(self, start_position: Vector2D, size: Vector2D = None):
         """
         Инициализация волка.
@@ -69,8 +86,12 @@ class Wolf:
         
         # ИИ и движение
         self.move_speed = 80.0  # пикселей в секунду
+        self.horizontal_damping = 0.85  # затухание горизонтальной скорости за кадр
         self.attack_range = 60.0  # дистанция атаки
         self.detection_range = 200.0  # дистанция обнаружения игрока
+        # Квадраты дистанций для сравнения без sqrt
+        self.attack_range_sq = self.attack_range * self.attack_range
+        self.detection_range_sq = self.detection_range * self.detection_range
         self.attack_damage = 15
         self.attack_cooldown = 1.5  # секунд между атаками
         self.last_attack_time = 0.0
@@ -81,8 +102,10 @@ class Wolf:
         
         # Визуализация
         self.sprites = {}
+        self.flipped_sprites = {}  # спрайт -> отраженная копия (строится при загрузке)
         self.current_sprite = None
         self.sprite_flip = False
+        self._needs_flip = True  # False для симметричной заглушки - отражать нечего
         
         # Анимация
         self.animation_timer = 0.0
@@ -90,6 +113,7 @@ class Wolf:
         self.walk_animation_speed = 6.0  # кадров в секунду
         
         # Загружаем спрайты
+        self._sprite_rect = None
         self._load_sprites()
         
         # Отладочная информация
@@ -135,12 +159,36 @@ class Wolf:
         except Exception as e:
             print(f"Ошибка загрузки спрайтов волка: {e}")
             # Создаем заглушку
-            fallback_sprite = pygame.Surface(sprite_size)
-            fallback_sprite.fill((100, 100, 100))  # Серый прямоугольник
+            fallback_sprite = self._get_fallback_sprite(sprite_size)
+            self._needs_flip = False
             
             self.sprites = {state: fallback_sprite for state in [WolfState.IDLE, WolfState.WALKING, WolfState.ATTACKING, WolfState.HURT, WolfState.DEAD]}
             self.walk_frames = [fallback_sprite] * 6
             self.current_sprite = fallback_sprite
+        
+        # Прямоугольник спрайта (все спрайты одного размера) - в render двигаем только центр
+        if self.current_sprite is not None:
+            self._sprite_rect = self.current_sprite.get_rect()
+        
+        # Отражаем все спрайты один раз, чтобы не делать flip при каждом рендере
+        self.flipped_sprites = {
+            sprite: asset_manager.get_flipped_image(sprite)
+            for sprite in (*self.sprites.values(), *self.walk_frames)
+            if sprite is not None
+        }
+    
+    @classmethod
+    def _get_fallback_sprite(cls, sprite_size: Tuple[int, int]) -> pygame.Surface:
+        """Возвращает общую серую заглушку нужного размера (создается один раз)."""
+        fallback_sprite = cls._FALLBACK_SPRITES.get(sprite_size)
+        if fallback_sprite is None:
+            fallback_sprite = pygame.Surface(sprite_size)
+            fallback_sprite.fill((100, 100, 100))  # Серый прямоугольник
+            if pygame.display.get_surface() is not None:
+                # Приводим к формату экрана, чтобы blit шел без конвертации
+                fallback_sprite = fallback_sprite.convert()
+            cls._FALLBACK_SPRITES[sprite_size] = fallback_sprite
+        return fallback_sprite
     
     def set_target(self, target) -> None:
         """Устанавливает цель для волка."""
@@ -184,19 +232,23 @@ class Wolf:
         if not self.health.is_alive or not self.target:
             return
         
-        # Вычисляем расстояние до цели
-        distance_to_target = self.physics_body.position.distance_to(self.target.physics_body.position)
+        # Смещение к цели (переиспользуется для движения) и квадрат расстояния
+        target_pos = self.target.physics_body.position
+        position = self.physics_body.position
+        dx = target_pos.x - position.x
+        dy = target_pos.y - position.y
+        distance_sq = dx * dx + dy * dy
         
         # Обновляем время последней атаки
         self.last_attack_time += delta_time
         
         # Логика ИИ
-        if distance_to_target <= self.attack_range and self.last_attack_time >= self.attack_cooldown:
+        if distance_sq <= self.attack_range_sq and self.last_attack_time >= self.attack_cooldown:
             # Атакуем
             self._attack_target()
-        elif distance_to_target <= self.detection_range:
+        elif distance_sq <= self.detection_range_sq:
             # Идем к цели
-            self._move_towards_target()
+            self._move_towards_target(dx, dy)
         else:
             # Цель слишком далеко, стоим на месте
             self._change_state(WolfState.IDLE)
@@ -214,25 +266,34 @@ class Wolf:
         
         print(f"Wolf attacked target for {self.attack_damage} damage!")
     
-    def _move_towards_target(self) -> None:
-        """Двигается к цели."""
+    def _move_towards_target(self, dx: Optional[float] = None, dy: Optional[float] = None) -> None:
+        """
+        Двигается к цели.
+        
+        Args:
+            dx: Смещение до цели по X (если уже посчитано в _update_ai)
+            dy: Смещение до цели по Y
+        """
         if not self.target:
             return
         
-        # Вычисляем направление к цели
-        direction = self.target.physics_body.position - self.physics_body.position
-        if direction.magnitude() > 0:
-            direction = direction.normalize()
+        # Вычисляем направление к цели (скалярами, без временных Vector2D)
+        if dx is None or dy is None:
+            target_pos = self.target.physics_body.position
+            dx = target_pos.x - self.physics_body.position.x
+            dy = target_pos.y - self.physics_body.position.y
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > 0:
+            direction_x = dx / math.sqrt(distance_sq)
             
             # Обновляем направление взгляда
-            if direction.x > 0:
+            if direction_x > 0:
                 self.facing_right = True
-            elif direction.x < 0:
+            elif direction_x < 0:
                 self.facing_right = False
             
             # Применяем силу движения
-            move_force = Vector2D(direction.x * self.move_speed * 10, 0)
-            self.physics_body.apply_force(move_force)
+            self.physics_body.apply_force_xy(direction_x * self.move_speed * 10, 0.0)
             
             self._change_state(WolfState.WALKING)
     
@@ -264,14 +325,12 @@ class Wolf:
         # Обновляем спрайт
         self._update_sprite()
         
-        # Применяем трение
-        self.physics_body.velocity = Vector2D(
-            self.physics_body.velocity.x * 0.85,
-            self.physics_body.velocity.y
-        )
+        # Применяем трение (на месте, без создания нового вектора)
+        self.physics_body.velocity.x *= self.horizontal_damping
         
-        # Обновляем отладочную информацию
-        self._update_debug_info()
+        # Обновляем отладочную информацию (только если она показывается)
+        if GameConfig.SHOW_DEBUG_INFO:
+            self._update_debug_info()
     
     def _update_debug_info(self) -> None:
         """Обновляет отладочную информацию."""
@@ -302,21 +361,21 @@ class Wolf:
         
         if sprite:
             # Позиционируем спрайт
-            sprite_rect = sprite.get_rect()
+            sprite_rect = self._sprite_rect
+            if sprite_rect is None:
+                sprite_rect = self._sprite_rect = sprite.get_rect()
             sprite_rect.center = (int(screen_pos.x), int(screen_pos.y))
             
-            # Поворачиваем спрайт если нужно
-            if self.sprite_flip:
-                sprite = pygame.transform.flip(sprite, True, False)
+            # Поворачиваем спрайт если нужно (отраженные копии готовы заранее)
+            if self.sprite_flip and self._needs_flip:
+                sprite = self.flipped_sprites.get(sprite) or asset_manager.get_flipped_image(sprite)
             
             # Эффект мигания при получении урона
             if self.health.is_invulnerable:
                 # Создаем эффект мигания
-                import time
-                if int(time.time() * 8) % 2:  # 8 раз в секунду
-                    # Делаем спрайт полупрозрачным
-                    sprite = sprite.copy()
-                    sprite.set_alpha(128)
+                if int(self.animation_timer * 8) & 1:  # 8 раз в секунду
+                    # Полупрозрачная копия общая для всех волков (кэш asset_manager)
+                    sprite = asset_manager.get_faded_image(sprite)
             
             # Рисуем спрайт
             surface.blit(sprite, sprite_rect)
@@ -4,18 +4,24 @@ Minimal working platformer with your textures and combat
 """
 
 import asyncio
+import gc
 import pygame
 import sys
+from collections import OrderedDict
 from typing import List, Dict
 from game.physics import Vector2D
 from game.simple_player import SimplePlayer
 from game.simple_wolf import SimpleWolf
+from game.shashka import SHASHKA_MIN_X, SHASHKA_MAX_X
 from game.simple_combat import SimpleCombat
 from game.bear_boss import BearBoss
 from game.balalaika import BalalaikaProjectile
 from game.assets import asset_manager
 from game.game_states import GameState, MenuScreen, DeathScreen, ParallaxBackground
 
+# В браузере (pygbag/WASM) цикл обязан отдавать управление каждый кадр
+IS_WEB = sys.platform == "emscripten"
+
 
 class Platform:
     """Простая платформа из блоков травы."""
@@ -24,6 +30,7 @@ class Platform:
         self.rect = pygame.Rect(int(x), int(y), int(width), int(height))
         self.grass_texture = None
         self.block_size = 64  # Размер одного блока травы
+        self.cached_surface = None  # Замощенная платформа (строится при первом рендере)
     
     def get_grass_texture(self):
         if self.grass_texture is None:
@@ -33,39 +40,36 @@ class Platform:
                 self.grass_texture = asset_manager.create_placeholder((self.block_size, self.block_size), (139, 69, 19), "GRASS")
         return self.grass_texture
     
+    def get_cached_surface(self) -> pygame.Surface:
+        """Возвращает платформу, заранее замощенную блоками травы (строится один раз)."""
+        if self.cached_surface is None:
+            grass_texture = self.get_grass_texture()
+            cached = pygame.Surface((self.rect.width, self.rect.height))
+            
+            # Замощаем блоками травы одним вызовом blits - края обрезаются
+            # границами поверхности, отдельные обрезанные блоки не нужны
+            cached.blits([
+                (grass_texture, (block_x, block_y))
+                for block_x in range(0, self.rect.width, self.block_size)
+                for block_y in range(0, self.rect.height, self.block_size)
+            ], False)
+            
+            # Приводим к формату экрана, чтобы blit шел без конвертации
+            if pygame.display.get_surface() is not None:
+                cached = cached.convert()
+            self.cached_surface = cached
+        return self.cached_surface
+    
     def render(self, surface: pygame.Surface, camera_offset: Vector2D = None):
         if camera_offset is None:
             camera_offset = Vector2D(0, 0)
         
-        grass_texture = self.get_grass_texture()
-        
-        # Рендерим платформу блоками травы
-        blocks_x = int(self.rect.width // self.block_size) + 1
-        blocks_y = int(self.rect.height // self.block_size) + 1
-        
-        for bx in range(blocks_x):
-            for by in range(blocks_y):
-                block_x = self.rect.x + bx * self.block_size
-                block_y = self.rect.y + by * self.block_size
-                
-                # Обрезаем блок если он выходит за границы платформы
-                clip_width = min(self.block_size, self.rect.right - block_x)
-                clip_height = min(self.block_size, self.rect.bottom - block_y)
-                
-                if clip_width > 0 and clip_height > 0:
-                    # Создаем обрезанную версию блока если нужно
-                    if clip_width < self.block_size or clip_height < self.block_size:
-                        clipped_texture = pygame.Surface((clip_width, clip_height))
-                        clipped_texture.blit(grass_texture, (0, 0), (0, 0, clip_width, clip_height))
-                        texture_to_render = clipped_texture
-                    else:
-                        texture_to_render = grass_texture
-                    
-                    render_pos = (
-                        int(block_x - camera_offset.x),
-                        int(block_y - camera_offset.y)
-                    )
-                    surface.blit(texture_to_render, render_pos)
+        # Один blit готовой поверхности вместо блита каждого блока
+        render_pos = (
+            int(self.rect.x - camera_offset.x),
+            int(self.rect.y - camera_offset.y)
+        )
+        surface.blit(self.get_cached_surface(), render_pos)
 
 
 class SimpleGame:
@@ -82,6 +86,9 @@ class SimpleGame:
         self.WINDOW_HEIGHT = 768
         self.TARGET_FPS = 60
         self.GRAVITY = 980.0
+        self.FIXED_DT = 1.0 / self.TARGET_FPS  # Фиксированный шаг симуляции
+        self.MAX_STEPS_PER_FRAME = 5  # Защита от лавины шагов после долгого кадра
+        self._accumulator = 0.0
         
         # Состояние игры
         self.current_state = GameState.MENU
@@ -95,19 +102,38 @@ class SimpleGame:
         self.bear = None  # Медведь-босс
         self.balalaikas = []  # Снаряды балалайки
         self.platforms = []
+        self._platform_grid = {}  # (cx, cy) -> индексы платформ в ячейке
+        self._platform_rects = []  # Прямоугольники платформ (для collidelist)
+        self.PLATFORM_GRID_CELL = 128
         self.combat_system = SimpleCombat()
         
         # Камера
         self.camera_position = Vector2D(0, 0)
         self.camera_smoothing = 5.0
+        self._camera_snapshot = Vector2D(0, 0)  # Целочисленная камера текущего кадра
+        self.VIEW_MARGIN = 100  # Запас вокруг экрана при отсечении невидимых объектов
         
         # Ввод
-        self.keys_pressed = set()
         self.key_events = []
         
         # Отладка
         self.debug_mode = False
         self.collision_debug = False
+        
+        # Шрифты (создаются в initialize после pygame.init)
+        self.font_ui = None
+        self.font_debug = None
+        self.font_large = None
+        self.font_medium = None
+        self.font_small = None
+        self.font_tiny = None
+        
+        # Кэш отрисованных строк UI: (шрифт, текст, цвет) -> поверхность
+        self._text_cache = OrderedDict()
+        self.TEXT_CACHE_SIZE = 64
+        self._victory_cached = None  # Оверлей и тексты экрана победы: [(поверхность, позиция)]
+        self.victory_shown = False
+        self._menu_drawn = False  # Меню уже выведено и не менялось
     
     def initialize(self) -> bool:
         """Инициализирует игру."""
@@ -119,6 +145,14 @@ class SimpleGame:
             self.clock = pygame.time.Clock()
             self.running = True
             
+            # Шрифты создаем один раз, а не в каждом кадре
+            self.font_ui = pygame.font.Font(None, 36)
+            self.font_debug = pygame.font.Font(None, 24)
+            self.font_large = pygame.font.Font(None, 72)
+            self.font_medium = pygame.font.Font(None, 48)
+            self.font_small = pygame.font.Font(None, 20)
+            self.font_tiny = pygame.font.Font(None, 16)
+            
             # Создаем экраны состояний
             self.menu_screen = MenuScreen(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
             self.death_screen = DeathScreen(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
@@ -158,6 +192,10 @@ class SimpleGame:
             Platform(2000, 0, 50, 800),  # Правая стена
         ]
         
+        # Сетка и список прямоугольников платформ (платформы статичны)
+        self._platform_rects = [platform.rect for platform in self.platforms]
+        self._build_platform_grid()
+        
         # Волки
         self.wolves = [
             SimpleWolf(Vector2D(500, 550)),
@@ -174,6 +212,34 @@ class SimpleGame:
         self.bear.set_target(self.player)
         self.balalaikas = []  # Сбрасываем снаряды балалайки
     
+    def _build_platform_grid(self):
+        """Раскладывает платформы по ячейкам сетки (индексы в self.platforms)."""
+        cell = self.PLATFORM_GRID_CELL
+        self._platform_grid = {}
+        for index, platform in enumerate(self.platforms):
+            rect = platform.rect
+            for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                    self._platform_grid.setdefault((cx, cy), []).append(index)
+    
+    def _platforms_near(self, rect: pygame.Rect) -> List[Platform]:
+        """
+        Возвращает платформы из ячеек, которые задевает прямоугольник.
+        
+        Прямоугольник расширяется на одну ячейку, чтобы учесть сдвиг объекта
+        при разрешении коллизий. Порядок платформ совпадает с self.platforms.
+        """
+        cell = self.PLATFORM_GRID_CELL
+        grid = self._platform_grid
+        indices = set()
+        for cx in range(rect.left // cell - 1, (rect.right - 1) // cell + 2):
+            for cy in range(rect.top // cell - 1, (rect.bottom - 1) // cell + 2):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    indices.update(bucket)
+        platforms = self.platforms
+        return [platforms[i] for i in sorted(indices)]
+    
     def handle_events(self):
         """Обрабатывает события."""
         self.key_events = []
@@ -184,8 +250,6 @@ class SimpleGame:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN:
-                self.keys_pressed.add(event.key)
-                
                 # Глобальные клавиши
                 if event.key == pygame.K_F1 and self.current_state == GameState.PLAYING:
                     self.debug_mode = not self.debug_mode
@@ -193,9 +257,7 @@ class SimpleGame:
                 elif event.key == pygame.K_F2 and self.current_state == GameState.PLAYING:
                     self.collision_debug = not getattr(self, 'collision_debug', False)
                     print(f"Collision debug: {'ON' if self.collision_debug else 'OFF'}")
-                    
-            elif event.type == pygame.KEYUP:
-                self.keys_pressed.discard(event.key)
+
     
     def update(self, delta_time: float):
         """Обновляет игру в зависимости от состояния."""
@@ -206,9 +268,43 @@ class SimpleGame:
         elif self.current_state == GameState.DEATH:
             self._update_death(delta_time)
     
+    def step(self, frame_time: float):
+        """
+        Продвигает игру на время кадра.
+        
+        Игровой процесс считается фиксированными шагами FIXED_DT через
+        аккумулятор, меню и экран смерти - один раз за кадр (события
+        кадра нельзя обрабатывать несколько раз).
+        
+        Args:
+            frame_time: Реальное время кадра в секундах
+        """
+        if self.current_state != GameState.PLAYING:
+            self._accumulator = 0.0
+            self.update(frame_time)
+            return
+        
+        fixed_dt = self.FIXED_DT
+        # Кадр почти ровно в шаг считаем ровным шагом - иначе дрожание
+        # clock.tick дает чередование кадров с 0 и 2 шагами
+        if abs(frame_time - fixed_dt) < 0.002:
+            frame_time = fixed_dt
+        self._accumulator += frame_time
+        
+        steps = 0
+        while (self._accumulator >= fixed_dt and steps < self.MAX_STEPS_PER_FRAME
+               and self.current_state == GameState.PLAYING):
+            self.update(fixed_dt)
+            self._accumulator -= fixed_dt
+            steps += 1
+        
+        # Не копим отставание (долгий кадр, смена состояния)
+        if steps == self.MAX_STEPS_PER_FRAME or self.current_state != GameState.PLAYING:
+            self._accumulator = 0.0
+    
     def _update_menu(self):
         """Обновляет меню."""
-        action = self.menu_screen.handle_input(self.keys_pressed, self.key_events)
+        action = self.menu_screen.handle_input(self.key_events)
         
         if action == "start_game":
             self._start_new_game()
@@ -218,7 +314,7 @@ class SimpleGame:
     def _update_death(self, delta_time: float):
         """Обновляет экран смерти."""
         self.death_screen.update(delta_time)
-        action = self.death_screen.handle_input(self.keys_pressed, self.key_events)
+        action = self.death_screen.handle_input(self.key_events)
         
         if action == "restart":
             self._start_new_game()
@@ -232,6 +328,12 @@ class SimpleGame:
         self._create_game_objects()
         self.current_state = GameState.PLAYING
         self.camera_position = Vector2D(0, 0)
+        
+        # Смена сцены: собираем мусор от прошлого мира и замораживаем новый,
+        # чтобы сборщик не обходил долгоживущие объекты во время игры
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
         print("🎮 New game started!")
     
     def _update_game(self, delta_time: float):
@@ -249,37 +351,40 @@ class SimpleGame:
         # Обновляем игрока
         self.player.update(delta_time)
         
-        # Проверяем коллизии игрока с платформами
-        for platform in self.platforms:
-            self.player.check_platform_collision(platform.rect)
+        # Проверяем коллизии игрока с платформами (поиск пересечений в C)
+        self.player.check_platform_collisions(self._platform_rects)
         
         # Проверяем, стоит ли игрок на земле (после всех коллизий)
-        platform_rects = [platform.rect for platform in self.platforms]
-        if not self.player.check_if_on_ground(platform_rects) and self.player.is_grounded:
+        if not self.player.check_if_on_ground(self._platform_rects) and self.player.is_grounded:
             # Игрок больше не на земле
             self.player.is_grounded = False
         
-        # Обрабатываем шашки игрока
-        for shashka in self.player.active_shashkas[:]:  # Копия списка
+        # Прямоугольники волков считаем один раз для всех шашек
+        wolf_rects = [wolf.get_rect() for wolf in self.wolves]
+        
+        # Обрабатываем шашки игрока (один проход, выжившие собираются в новый список)
+        remaining_shashkas = []
+        for shashka in self.player.active_shashkas:
             shashka.update(delta_time)
             
             # Проверить столкновение с платформами
             if shashka.check_collision(self.platforms):
-                self.player.active_shashkas.remove(shashka)
                 print("💥 Шашка попала в платформу!")
                 continue
             
             # Проверить столкновение с врагами
-            hit_enemy = shashka.check_enemy_collision(self.wolves)
+            hit_enemy = shashka.check_enemy_collision(self.wolves, wolf_rects)
             if hit_enemy:
                 # Наносим урон
                 hit_enemy.take_damage(shashka.damage)
-                self.player.active_shashkas.remove(shashka)
                 print(f"🎯 Попадание! Урон: {shashka.damage}, здоровье врага: {hit_enemy.health}")
                 
                 # Проверить смерть волка
                 if hit_enemy.health <= 0:
-                    self.wolves.remove(hit_enemy)
+                    # Удаляем волка вместе с его прямоугольником, чтобы индексы совпадали
+                    index = self.wolves.index(hit_enemy)
+                    del self.wolves[index]
+                    del wolf_rects[index]
                     print("💀 Волк убит шашкой!")
                 continue
             
@@ -288,29 +393,34 @@ class SimpleGame:
                 bear_rect = self.bear.get_rect()
                 if shashka.get_rect().colliderect(bear_rect):
                     self.bear.take_damage(shashka.damage)
-                    self.player.active_shashkas.remove(shashka)
                     print(f"🎯 Попадание в медведя! Урон: {shashka.damage}")
                     continue
             
             # Проверить выход за экран (мировые координаты с буфером)
-            BUFFER_ZONE = 200
-            WORLD_WIDTH = 2000  # Размер игрового мира
-            if (shashka.x < -BUFFER_ZONE or shashka.x > WORLD_WIDTH + BUFFER_ZONE):
-                self.player.active_shashkas.remove(shashka)
+            if shashka.x < SHASHKA_MIN_X or shashka.x > SHASHKA_MAX_X:
                 print(f"🌀 Шашка удалена: x={shashka.x:.1f}, причина: граница мира")
+                continue
+            
+            remaining_shashkas.append(shashka)
+        
+        # Тот же объект списка - игрок берет из него свободные шашки пула
+        self.player.active_shashkas[:] = remaining_shashkas
         
-        # Обновляем волков
-        for wolf in self.wolves[:]:  # Копия списка для безопасного удаления
+        # Обновляем волков (мертвые отсеиваются тем же проходом)
+        living_wolves = []
+        for wolf in self.wolves:
             if wolf.is_dead:
-                self.wolves.remove(wolf)
                 continue
             
             wolf.update(delta_time)
             
-            # Проверяем коллизии волка с платформами
+            # Проверяем коллизии волка с ближайшими платформами
             wolf.is_grounded = False
-            for platform in self.platforms:
+            for platform in self._platforms_near(wolf.get_rect()):
                 wolf.check_platform_collision(platform.rect)
+            
+            living_wolves.append(wolf)
+        self.wolves[:] = living_wolves
         
         # Обновляем медведя-босса
         if self.bear and not self.bear.is_dead:
@@ -323,23 +433,25 @@ class SimpleGame:
             
             # Проверяем коллизии медведя с платформами
             self.bear.is_grounded = False
-            for platform in self.platforms:
+            for platform in self._platforms_near(self.bear.get_rect()):
                 self.bear.check_platform_collision(platform.rect)
         
-        # Обновляем балалайки
-        for balalaika in self.balalaikas[:]:  # Копия списка
+        # Обновляем балалайки (один проход, без копии списка и remove)
+        player_rect = self.player.get_rect()
+        active_balalaikas = []
+        for balalaika in self.balalaikas:
             balalaika.update(delta_time)
             
             # Проверяем столкновение с игроком
-            if balalaika.check_player_collision(self.player.get_rect()):
+            if balalaika.check_player_collision(player_rect):
                 self.player.take_damage(balalaika.damage)
-                self.balalaikas.remove(balalaika)
                 print("💥 Игрок получил урон от балалайки!")
                 continue
             
             # Удаляем неактивные балалайки
-            if not balalaika.active:
-                self.balalaikas.remove(balalaika)
+            if balalaika.active:
+                active_balalaikas.append(balalaika)
+        self.balalaikas[:] = active_balalaikas
         
         # Обрабатываем атаки игрока
         if self.player.input_attack:
@@ -370,47 +482,48 @@ class SimpleGame:
     
     def _handle_input(self):
         """Обрабатывает ввод в игре."""
+        # Состояние клавиатуры одним вызовом (индексация в C вместо поиска в множестве)
+        keys = pygame.key.get_pressed()
+        
         # Проверяем ESC для выхода в меню
-        if pygame.K_ESCAPE in self.keys_pressed:
+        if keys[pygame.K_ESCAPE]:
             self.current_state = GameState.MENU
             return
         
         # Горизонтальное движение
-        horizontal = 0.0
-        if pygame.K_a in self.keys_pressed or pygame.K_LEFT in self.keys_pressed:
-            horizontal -= 1.0
-        if pygame.K_d in self.keys_pressed or pygame.K_RIGHT in self.keys_pressed:
-            horizontal += 1.0
+        horizontal = ((keys[pygame.K_d] or keys[pygame.K_RIGHT]) -
+                      (keys[pygame.K_a] or keys[pygame.K_LEFT]))
         
         # Прыжок
-        jump = (pygame.K_w in self.keys_pressed or 
-                pygame.K_UP in self.keys_pressed or 
-                pygame.K_SPACE in self.keys_pressed)
+        jump = keys[pygame.K_w] or keys[pygame.K_UP] or keys[pygame.K_SPACE]
         
         # Атака
-        attack = (pygame.K_x in self.keys_pressed or 
-                 pygame.K_LCTRL in self.keys_pressed or
-                 pygame.K_RCTRL in self.keys_pressed)
+        attack = keys[pygame.K_x] or keys[pygame.K_LCTRL] or keys[pygame.K_RCTRL]
         
         # Метание шашки
-        throw_shashka = pygame.K_z in self.keys_pressed
+        throw_shashka = keys[pygame.K_z]
         
         if self.player:
-            self.player.set_input(horizontal, jump, attack, throw_shashka)
+            self.player.set_input(float(horizontal), jump, attack, throw_shashka)
     
     def _update_camera(self, delta_time: float):
         """Обновляет позицию камеры."""
+        camera = self.camera_position
+        cam_x = camera.x
+        cam_y = camera.y
+        
         # Следуем за игроком
         target_x = self.player.position.x - self.WINDOW_WIDTH // 2
         target_y = self.player.position.y - self.WINDOW_HEIGHT // 2
         
-        # Плавное движение камеры
-        self.camera_position.x += (target_x - self.camera_position.x) * self.camera_smoothing * delta_time
-        self.camera_position.y += (target_y - self.camera_position.y) * self.camera_smoothing * delta_time
+        # Плавное движение камеры (считаем на локальных float)
+        k = self.camera_smoothing * delta_time
+        cam_x += (target_x - cam_x) * k
+        cam_y += (target_y - cam_y) * k
         
         # Ограничиваем камеру границами мира
-        self.camera_position.x = max(0, min(self.camera_position.x, 2000 - self.WINDOW_WIDTH))
-        self.camera_position.y = max(-200, min(self.camera_position.y, 700 - self.WINDOW_HEIGHT))
+        camera.x = max(0, min(cam_x, 2000 - self.WINDOW_WIDTH))
+        camera.y = max(-200, min(cam_y, 700 - self.WINDOW_HEIGHT))
     
     def _check_world_bounds(self):
         """Проверяет границы мира."""
@@ -429,7 +542,7 @@ class SimpleGame:
     
     def _show_victory_message(self):
         """Показывает сообщение о победе."""
-        if not hasattr(self, 'victory_shown'):
+        if not self.victory_shown:
             self.victory_shown = True
             print("🎉 VICTORY! All wolves defeated!")
             print("🏆 You have defended Ingushetia!")
@@ -437,37 +550,54 @@ class SimpleGame:
     def _render_victory_screen(self):
         """Рендерит экран победы."""
         if len(self.wolves) == 0:
-            # Полупрозрачный оверлей
-            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            self.screen.blit(overlay, (0, 0))
-            
-            # Текст победы
-            font_large = pygame.font.Font(None, 72)
-            font_medium = pygame.font.Font(None, 48)
-            
-            victory_text = font_large.render("VICTORY!", True, (255, 215, 0))
-            victory_rect = victory_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 - 50))
-            self.screen.blit(victory_text, victory_rect)
-            
-            subtitle_text = font_medium.render("All wolves defeated!", True, (255, 255, 255))
-            subtitle_rect = subtitle_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 + 20))
-            self.screen.blit(subtitle_text, subtitle_rect)
-            
-            restart_text = font_medium.render("Press R to restart or ESC to quit", True, (200, 200, 200))
-            restart_rect = restart_text.get_rect(center=(self.WINDOW_WIDTH // 2, self.WINDOW_HEIGHT // 2 + 80))
-            self.screen.blit(restart_text, restart_rect)
+            # Оверлей и тексты не меняются - строим один раз, дальше только blits
+            if self._victory_cached is None:
+                self._victory_cached = self._build_victory_screen()
+            self.screen.blits(self._victory_cached, False)
+    
+    def _build_victory_screen(self) -> list:
+        """
+        Строит поверхности экрана победы.
+        
+        Returns:
+            Список пар (поверхность, позиция) для Surface.blits
+        """
+        center_x = self.WINDOW_WIDTH // 2
+        center_y = self.WINDOW_HEIGHT // 2
+        
+        # Полупрозрачный оверлей
+        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 128))
+        
+        # Текст победы
+        victory_text = self.font_large.render("VICTORY!", True, (255, 215, 0))
+        subtitle_text = self.font_medium.render("All wolves defeated!", True, (255, 255, 255))
+        restart_text = self.font_medium.render("Press R to restart or ESC to quit", True, (200, 200, 200))
+        
+        return [
+            (overlay, (0, 0)),
+            (victory_text, victory_text.get_rect(center=(center_x, center_y - 50))),
+            (subtitle_text, subtitle_text.get_rect(center=(center_x, center_y + 20))),
+            (restart_text, restart_text.get_rect(center=(center_x, center_y + 80))),
+        ]
     
     def render(self):
         """Рендерит игру в зависимости от состояния."""
         if self.current_state == GameState.MENU:
+            # Меню статично: кадр меняется только после событий (ввод, перерисовка окна),
+            # поэтому без них экран не перерисовываем и не выводим заново
+            if self._menu_drawn and not self.key_events:
+                return
             self.menu_screen.render(self.screen)
+            self._menu_drawn = True
         elif self.current_state == GameState.PLAYING:
             self._render_game()
+            self._menu_drawn = False
         elif self.current_state == GameState.DEATH:
             # Рендерим игру на фоне, затем экран смерти
             self._render_game()
             self.death_screen.render(self.screen)
+            self._menu_drawn = False
         
         # Обновляем экран
         pygame.display.flip()
@@ -477,32 +607,51 @@ class SimpleGame:
         # Рендерим параллакс фон
         self.parallax_background.render(self.screen)
         
-        # Рендерим платформы
-        for platform in self.platforms:
-            platform.render(self.screen, self.camera_position)
+        # Целочисленный снимок камеры на кадр: все объекты сдвигаются на одни и те же
+        # пиксели (без взаимного дрожания), а рендерерам не нужно округлять камеру
+        camera = self._camera_snapshot
+        camera.x = int(self.camera_position.x)
+        camera.y = int(self.camera_position.y)
+        
+        # Видимая область мира (с запасом под полоски здоровья и повороты спрайтов)
+        view = pygame.Rect(
+            camera.x, camera.y,
+            self.WINDOW_WIDTH, self.WINDOW_HEIGHT
+        ).inflate(2 * self.VIEW_MARGIN, 2 * self.VIEW_MARGIN)
+        
+        # Рендерим платформы (только видимые) одним вызовом blits
+        self.screen.blits([
+            (platform.get_cached_surface(), (platform.rect.x - camera.x, platform.rect.y - camera.y))
+            for platform in self.platforms
+            if view.colliderect(platform.rect)
+        ], False)
         
         # Рендерим игрока
         if self.player:
-            self.player.render(self.screen, self.camera_position, self.debug_mode)
+            self.player.render(self.screen, camera, self.debug_mode)
             
             # Рендерим шашки игрока
-            self.player.render_shashkas(self.screen, self.camera_position)
+            self.player.render_shashkas(self.screen, camera, view)
         
         # Рендерим оружие игрока
         if self.player:
-            self.combat_system.render_weapon(self.screen, self.player, self.camera_position)
+            self.combat_system.render_weapon(self.screen, self.player, camera)
         
-        # Рендерим волков
+        # Рендерим волков (только видимых)
         for wolf in self.wolves:
-            wolf.render(self.screen, self.camera_position)
+            if view.colliderect(wolf.get_rect()):
+                wolf.render(self.screen, camera)
         
         # Рендерим медведя-босса
-        if self.bear and not self.bear.is_dead:
-            self.bear.render(self.screen, self.camera_position)
+        if self.bear and not self.bear.is_dead and view.colliderect(self.bear.get_rect()):
+            self.bear.render(self.screen, camera)
         
-        # Рендерим балалайки
-        for balalaika in self.balalaikas:
-            balalaika.draw(self.screen, self.camera_position)
+        # Рендерим балалайки (только видимые) одним вызовом blits
+        self.screen.blits([
+            (balalaika.sprite, balalaika.get_render_pos(camera))
+            for balalaika in self.balalaikas
+            if balalaika.active and view.colliderect(balalaika.get_rect())
+        ], False)
         
         # Отладочная информация
         if self.debug_mode:
@@ -518,9 +667,22 @@ class SimpleGame:
         # Рендерим экран победы если нужно
         self._render_victory_screen()
     
+    def _text(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        """Возвращает отрисованный текст, перерисовывая только изменившиеся строки."""
+        key = (font, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, color)
+            self._text_cache[key] = text_surface
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return text_surface
+    
     def _render_debug_info(self):
         """Рендерит отладочную информацию."""
-        font = pygame.font.Font(None, 24)
+        font = self.font_debug
         
         # Эффективное состояние "на земле"
         effective_on_ground = self.player.is_grounded and self.player.in_air_frames < 3
@@ -545,7 +707,7 @@ class SimpleGame:
             elif "In Air Frames:" in info and self.player.in_air_frames > 3 and self.player.is_grounded:
                 color = (255, 150, 0)  # Оранжевый - нестабильность
             
-            text_surface = font.render(info, True, color)
+            text_surface = self._text(font, info, color)
             self.screen.blit(text_surface, (10, y_offset))
             y_offset += 25
         
@@ -557,13 +719,9 @@ class SimpleGame:
         if not self.player:
             return
         
-        # Константы границ
-        BUFFER_ZONE = 200
-        WORLD_WIDTH = 2000
-        
-        # Рендерим границы мира
-        left_boundary = -BUFFER_ZONE - self.camera_position.x
-        right_boundary = WORLD_WIDTH + BUFFER_ZONE - self.camera_position.x
+        # Рендерим границы мира (те же, по которым удаляются шашки)
+        left_boundary = SHASHKA_MIN_X - self.camera_position.x
+        right_boundary = SHASHKA_MAX_X - self.camera_position.x
         
         # Левая граница (красная линия)
         if left_boundary > -50 and left_boundary < self.WINDOW_WIDTH + 50:
@@ -572,8 +730,8 @@ class SimpleGame:
                            (int(left_boundary), self.WINDOW_HEIGHT), 3)
             
             # Подпись
-            font = pygame.font.Font(None, 24)
-            text = font.render(f"LEFT BOUNDARY ({-BUFFER_ZONE})", True, (255, 0, 0))
+            font = self.font_debug
+            text = font.render(f"LEFT BOUNDARY ({SHASHKA_MIN_X})", True, (255, 0, 0))
             self.screen.blit(text, (int(left_boundary) + 5, 50))
         
         # Правая граница (красная линия)
@@ -583,8 +741,8 @@ class SimpleGame:
                            (int(right_boundary), self.WINDOW_HEIGHT), 3)
             
             # Подпись
-            font = pygame.font.Font(None, 24)
-            text = font.render(f"RIGHT BOUNDARY ({WORLD_WIDTH + BUFFER_ZONE})", True, (255, 0, 0))
+            font = self.font_debug
+            text = font.render(f"RIGHT BOUNDARY ({SHASHKA_MAX_X})", True, (255, 0, 0))
             self.screen.blit(text, (int(right_boundary) - 200, 50))
         
         # Рендерим коллизии шашек
@@ -602,7 +760,7 @@ class SimpleGame:
             pygame.draw.rect(self.screen, color, screen_rect, 2)
             
             # Координаты шашки
-            font = pygame.font.Font(None, 20)
+            font = self.font_small
             coord_text = font.render(f"({shashka.position.x:.0f},{shashka.position.y:.0f})", True, color)
             self.screen.blit(coord_text, (screen_rect.x, screen_rect.y - 20))
         
@@ -633,7 +791,7 @@ class SimpleGame:
             pygame.draw.rect(self.screen, (255, 165, 0), screen_rect, 2)
             
             # Состояние медведя
-            font = pygame.font.Font(None, 16)
+            font = self.font_tiny
             state_text = font.render(f"Bear: {self.bear.state}", True, (255, 165, 0))
             self.screen.blit(state_text, (screen_rect.x, screen_rect.y - 20))
         
@@ -652,10 +810,10 @@ class SimpleGame:
             pygame.draw.rect(self.screen, color, screen_rect, 2)
         
         # Информация о границах
-        info_font = pygame.font.Font(None, 24)
+        info_font = self.font_debug
         info_texts = [
             f"Camera X: {self.camera_position.x:.1f}",
-            f"World boundaries: {-BUFFER_ZONE} to {WORLD_WIDTH + BUFFER_ZONE}",
+            f"World boundaries: {SHASHKA_MIN_X} to {SHASHKA_MAX_X}",
             f"Active shashkas: {len(self.player.active_shashkas)}",
             f"Active balalaikas: {len(self.balalaikas)}",
             f"Bear alive: {self.bear and not self.bear.is_dead}",
@@ -671,44 +829,44 @@ class SimpleGame:
         if not self.player:
             return
             
-        font = pygame.font.Font(None, 36)
+        font = self.font_ui
         
         # FPS
         fps = self.clock.get_fps()
-        fps_text = font.render(f"FPS: {fps:.1f}", True, (255, 255, 0))
+        fps_text = self._text(font, f"FPS: {fps:.1f}", (255, 255, 0))
         self.screen.blit(fps_text, (self.WINDOW_WIDTH - 150, 10))
         
         # Счетчик врагов
         total_enemies = len(self.wolves) + (1 if self.bear and not self.bear.is_dead else 0)
-        enemies_text = font.render(f"Enemies: {total_enemies}", True, (255, 255, 255))
+        enemies_text = self._text(font, f"Enemies: {total_enemies}", (255, 255, 255))
         self.screen.blit(enemies_text, (10, 10))
         
         # Информация о медведе-боссе
         if self.bear and not self.bear.is_dead:
-            bear_health_text = font.render(f"Boss HP: {self.bear.health}/{self.bear.max_health}", True, (255, 100, 0))
+            bear_health_text = self._text(font, f"Boss HP: {self.bear.health}/{self.bear.max_health}", (255, 100, 0))
             self.screen.blit(bear_health_text, (10, 160))
         
         # Здоровье игрока (большое)
-        health_text = font.render(f"Health: {self.player.health}/{self.player.max_health}", True, (255, 255, 255))
+        health_text = self._text(font, f"Health: {self.player.health}/{self.player.max_health}", (255, 255, 255))
         self.screen.blit(health_text, (self.WINDOW_WIDTH // 2 - 100, 10))
         
         # Количество шашек и восстановление
-        shashkas_text = font.render(f"Shashkas: {self.player.shashka_count}/{self.player.MAX_SHASHKAS}", True, (255, 255, 255))
+        shashkas_text = self._text(font, f"Shashkas: {self.player.shashka_count}/{self.player.MAX_SHASHKAS}", (255, 255, 255))
         self.screen.blit(shashkas_text, (10, 50))
         
         # Активные шашки в полете
-        active_text = font.render(f"In flight: {len(self.player.active_shashkas)}", True, (200, 200, 200))
+        active_text = self._text(font, f"In flight: {len(self.player.active_shashkas)}", (200, 200, 200))
         self.screen.blit(active_text, (10, 75))
         
         # Кулдаун шашки
         if self.player.shashka_cooldown > 0:
-            cooldown_text = font.render(f"Cooldown: {self.player.shashka_cooldown:.1f}s", True, (255, 255, 0))
+            cooldown_text = self._text(font, f"Cooldown: {self.player.shashka_cooldown:.1f}s", (255, 255, 0))
             self.screen.blit(cooldown_text, (10, 100))
         
         # Восстановление шашек
         if self.player.shashka_count < self.player.MAX_SHASHKAS:
             regen_progress = self.player.shashka_regen_timer / self.player.SHASHKA_REGEN_TIME
-            regen_text = font.render(f"Regen: {regen_progress*100:.0f}%", True, (0, 255, 255))
+            regen_text = self._text(font, f"Regen: {regen_progress*100:.0f}%", (0, 255, 255))
             self.screen.blit(regen_text, (10, 125))
             
             # Полоска прогресса восстановления
@@ -737,6 +895,8 @@ class SimpleGame:
         
         print("Starting simple game loop...")
         
+        yield_each_frame = IS_WEB
+        
         try:
             while self.running:
                 # Вычисляем delta time
@@ -745,14 +905,16 @@ class SimpleGame:
                 # Обрабатываем события
                 self.handle_events()
                 
-                # Обновляем игру
-                self.update(self.delta_time)
+                # Обновляем игру (фиксированным шагом)
+                self.step(self.delta_time)
                 
                 # Рендерим
                 self.render()
                 
-                # Уступаем управление для async
-                await asyncio.sleep(0)
+                # Уступаем управление для async (только в браузере - на десктопе
+                # кадр и так выравнивает clock.tick, других задач в цикле нет)
+                if yield_each_frame:
+                    await asyncio.sleep(0)
                 
         except KeyboardInterrupt:
             print("Game interrupted by user")
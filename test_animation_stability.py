@@ -13,7 +13,7 @@ def test_animation_stability():
     """Тестирует стабилизацию анимации игрока."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))  # Минимальное окно
     
     # Создаем игрока
@@ -188,8 +188,7 @@ def test_animation_stability():
         print()
     
     print("=== ТЕСТ ЗАВЕРШЕН ===")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_animation_stability()
\ No newline at end of file
+    test_animation_stability()
+    pygame.quit()
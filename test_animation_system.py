@@ -12,7 +12,7 @@ def test_animation_states():
     """Тестирует состояния анимации игрока."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))  # Минимальное окно
     
     # Создаем игрока
@@ -117,8 +117,7 @@ def test_animation_states():
     
     print()
     print("=== ТЕСТ ЗАВЕРШЕН ===")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_animation_states()
\ No newline at end of file
+    test_animation_states()
+    pygame.quit()
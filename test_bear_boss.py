@@ -14,7 +14,7 @@ def test_bear_boss():
     """Тестирует систему медведя-босса."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))
     
     print("=== ТЕСТ МЕДВЕДЯ-БОССА ===")
@@ -138,12 +138,15 @@ def test_bear_boss():
     # Тест 7: Баланс боя
     print("7. Тест баланса боя:")
     
+    # Параметры читаем с одного эталонного медведя (без загрузки спрайтов на каждую строку)
+    reference_bear = BearBoss(0, 0)
+    
     print("   Медведь-босс:")
-    print(f"     Здоровье: {BearBoss(0, 0).max_health} HP")
-    print(f"     Урон лапой: {BearBoss(0, 0).damage_melee} HP")
-    print(f"     Урон балалайкой: {BearBoss(0, 0).damage_balalaika} HP")
-    print(f"     Кулдаун атаки: {BearBoss(0, 0).attack_cooldown} сек")
-    print(f"     Кулдаун балалайки: {BearBoss(0, 0).balalaika_cooldown} сек")
+    print(f"     Здоровье: {reference_bear.max_health} HP")
+    print(f"     Урон лапой: {reference_bear.damage_melee} HP")
+    print(f"     Урон балалайкой: {reference_bear.damage_balalaika} HP")
+    print(f"     Кулдаун атаки: {reference_bear.attack_cooldown} сек")
+    print(f"     Кулдаун балалайки: {reference_bear.balalaika_cooldown} сек")
     
     print("   Игрок:")
     print(f"     Урон шашкой: 15 HP")
@@ -154,7 +157,7 @@ def test_bear_boss():
     time_to_kill = (100 // 15) * shashka_cooldown
     print(f"     Минимальное время убийства: {time_to_kill:.1f} секунд")
     
-    bear_dps = BearBoss(0, 0).damage_melee / BearBoss(0, 0).attack_cooldown
+    bear_dps = reference_bear.damage_melee / reference_bear.attack_cooldown
     print(f"     DPS медведя: {bear_dps:.1f} HP/сек")
     
     print("   ✅ Баланс рассчитан")
@@ -170,8 +173,7 @@ def test_bear_boss():
     print("✅ Баланс: рассчитан")
     print()
     print("🐻 Медведь-босс готов к бою!")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_bear_boss()
\ No newline at end of file
+    test_bear_boss()
+    pygame.quit()
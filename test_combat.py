@@ -111,8 +111,7 @@ def test_combat():
     print("✅ Смерть работает")
     print("✅ Health bar-ы работают")
     print("\n⚔️ Боевая система готова!")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_combat()
\ No newline at end of file
+    test_combat()
+    pygame.quit()
@@ -12,7 +12,7 @@ def simulate_game_loop():
     """Симулирует игровой цикл с проверкой анимации."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))
     
     # Создаем игрока
@@ -140,8 +140,7 @@ def simulate_game_loop():
     print("✅ Приземление: должно стабильно перейти в 'idle'")
     print()
     print("Если все состояния корректны - дрожание исправлено! 🎉")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    simulate_game_loop()
\ No newline at end of file
+    simulate_game_loop()
+    pygame.quit()
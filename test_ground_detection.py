@@ -12,7 +12,7 @@ def test_ground_detection():
     """Тестирует обнаружение земли."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))
     
     # Создаем игрока
@@ -118,8 +118,35 @@ def test_ground_detection():
     print()
     
     print("=== ТЕСТ ЗАВЕРШЕН ===")
-    
-    pygame.quit()
+
+def test_platform_collisions_batch():
+    """Пакетная проверка коллизий совпадает с проверкой по одной платформе."""
+    print("=== ТЕСТ ПАКЕТНЫХ КОЛЛИЗИЙ ===")
+    
+    platforms = [
+        pygame.Rect(0, 572, 400, 20),    # Пол
+        pygame.Rect(180, 450, 50, 150),  # Стена справа от игрока
+        pygame.Rect(600, 300, 100, 20),  # Далекая платформа
+    ]
+    
+    for start_x, start_y, velocity_x, velocity_y in [(100, 510, 0, 200), (140, 500, 300, 0), (650, 100, 0, 0)]:
+        single = SimplePlayer(Vector2D(start_x, start_y))
+        batch = SimplePlayer(Vector2D(start_x, start_y))
+        for player in (single, batch):
+            player.velocity = Vector2D(velocity_x, velocity_y)
+        
+        for platform_rect in platforms:
+            single.check_platform_collision(platform_rect)
+        batch.check_platform_collisions(platforms)
+        
+        print(f"   Старт ({start_x}, {start_y}): по одной {single.position}, пакетом {batch.position}")
+        assert batch.position == single.position
+        assert batch.velocity == single.velocity
+        assert batch.is_grounded == single.is_grounded
+    
+    print("   ✓ Результаты совпадают")
 
 if __name__ == "__main__":
-    test_ground_detection()
\ No newline at end of file
+    test_ground_detection()
+    test_platform_collisions_batch()
+    pygame.quit()
@@ -54,11 +54,11 @@ def test_new_features():
     
     # Симуляция навигации
     fake_events = [
-        type('Event', (), {'type': pygame.KEYDOWN, 'key': pygame.K_DOWN})(),
-        type('Event', (), {'type': pygame.KEYDOWN, 'key': pygame.K_UP})(),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP),
     ]
     
-    menu.handle_input(set(), fake_events)
+    menu.handle_input(fake_events)
     print(f"   Навигация работает: ✅")
     print()
     
@@ -131,8 +131,7 @@ def test_new_features():
     print("✅ Рендеринг: работает")
     print()
     print("🎮 Все новые функции готовы к использованию!")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_new_features()
\ No newline at end of file
+    test_new_features()
+    pygame.quit()
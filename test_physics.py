@@ -37,6 +37,10 @@ def test_vector2d_basic_operations():
     expected_x, expected_y = 3/5, 4/5
     assert abs(v6.x - expected_x) < 1e-6 and abs(v6.y - expected_y) < 1e-6, f"Normalization failed: {v6}"
     
+    # Test squared distance
+    dist_sq = Vector2D(0, 0).distance_squared_to(v1)
+    assert dist_sq == 25, f"Squared distance failed: {dist_sq} != 25"
+    
     print("✓ Vector2D basic operations passed")
 
 
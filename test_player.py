@@ -3,11 +3,16 @@
 Tests for player module
 """
 
+import os
 import pygame
 from game.physics import Vector2D
 from game.player import Player, PlayerState, PlayerStats
 from game.collision import CollisionSystem, Collider, CollisionLayer
 
+# Rendering is only checked on an off-screen Surface: no real video/audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 
 def test_player_creation():
     """Test player creation and initialization."""
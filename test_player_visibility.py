@@ -34,12 +34,12 @@ def test_player_stays_visible():
         collision_system.update(1.0 / 60.0)
         
         # Check player is still in reasonable bounds
-        pos = player.get_position()
-        assert -200 < pos.x < 2200, f"Player X out of bounds: {pos.x}"
-        assert -600 < pos.y < 1100, f"Player Y out of bounds: {pos.y}"
+        pos_x, pos_y = player.get_xy()
+        assert -200 < pos_x < 2200, f"Player X out of bounds: {pos_x}"
+        assert -600 < pos_y < 1100, f"Player Y out of bounds: {pos_y}"
         
         if player.is_grounded:
-            print(f"Player landed after {i+1} frames at {pos}")
+            print(f"Player landed after {i+1} frames at ({pos_x}, {pos_y})")
             break
     
     final_pos = player.get_position()
@@ -68,17 +68,17 @@ def test_player_collision_stability():
     platform = platform_manager.add_platform(Vector2D(200, 200), Vector2D(150, 30))
     collision_system.add_collider(platform.collider)
     
-    initial_pos = player.get_position()
+    initial_x, initial_y = player.get_xy()
     
     # Update for several frames
     for i in range(30):
         player.update(1.0 / 60.0)
         collision_system.update(1.0 / 60.0)
         
-        pos = player.get_position()
+        pos_x, pos_y = player.get_xy()
         
         # Player shouldn't move too far from initial position
-        distance_moved = abs(pos.x - initial_pos.x) + abs(pos.y - initial_pos.y)
+        distance_moved = abs(pos_x - initial_x) + abs(pos_y - initial_y)
         assert distance_moved < 100, f"Player moved too far: {distance_moved} pixels"
     
     print("✓ Collision stability test passed")
@@ -111,11 +111,11 @@ def test_multiple_platform_collisions():
         player.update(1.0 / 60.0)
         collision_system.update(1.0 / 60.0)
         
-        pos = player.get_position()
+        pos_x, pos_y = player.get_xy()
         
         # Player should stay in reasonable bounds
-        assert -100 < pos.x < 500, f"Player X out of bounds: {pos.x}"
-        assert -100 < pos.y < 400, f"Player Y out of bounds: {pos.y}"
+        assert -100 < pos_x < 500, f"Player X out of bounds: {pos_x}"
+        assert -100 < pos_y < 400, f"Player Y out of bounds: {pos_y}"
     
     print("✓ Multiple platform collision test passed")
 
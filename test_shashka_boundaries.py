@@ -13,7 +13,7 @@ def test_shashka_boundaries():
     """Тестирует границы удаления шашек."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))
     
     print("=== ТЕСТ ГРАНИЦ ШАШКИ ===")
@@ -165,8 +165,7 @@ def test_shashka_boundaries():
     print("   1. Проверь координаты камеры")
     print("   2. Убедись что используются мировые координаты")
     print("   3. Нажми F2 в игре для визуальной отладки")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_shashka_boundaries()
\ No newline at end of file
+    test_shashka_boundaries()
+    pygame.quit()
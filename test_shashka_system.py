@@ -14,7 +14,7 @@ def test_shashka_system():
     """Тестирует систему метания шашки."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))
     
     print("=== ТЕСТ СИСТЕМЫ ШАШКИ ===")
@@ -186,8 +186,35 @@ def test_shashka_system():
     print("✅ Убийство врагов: работает (2 попадания)")
     print()
     print("🎯 Система шашки готова к использованию!")
+
+def test_shashka_pool_reuse():
+    """Тестирует переиспользование шашек из пула игрока."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
     
-    pygame.quit()
+    print("=== ТЕСТ ПУЛА ШАШЕК ===")
+    player = SimplePlayer(Vector2D(100, 300))
+    pool_ids = {id(s) for s in player._shashka_pool}
+    
+    # Бросок берет шашку из пула и сбрасывает её состояние
+    player.set_input(0, False, False, True)
+    player._handle_shashka_throwing()
+    first = player.active_shashkas[0]
+    assert id(first) in pool_ids, "Шашка должна браться из пула"
+    assert first.active and first.lifetime == 0.0
+    
+    # Игра удаляет шашку из списка сама (как при попадании) - она снова свободна
+    first.active = False
+    player.active_shashkas.remove(first)
+    player.shashka_cooldown = 0.0
+    player.facing_right = False
+    player._handle_shashka_throwing()
+    second = player.active_shashkas[0]
+    assert second is first, "Свободная шашка должна переиспользоваться"
+    assert second.active and second.direction == -1 and second.velocity.x < 0
+    print("   ✅ Пул шашек работает")
 
 if __name__ == "__main__":
-    test_shashka_system()
\ No newline at end of file
+    test_shashka_system()
+    test_shashka_pool_reuse()
+    pygame.quit()
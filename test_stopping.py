@@ -12,7 +12,7 @@ def test_stopping():
     """Тестирует остановку и переход в idle."""
     
     # Инициализируем pygame минимально
-    pygame.init()
+    pygame.display.init()
     pygame.display.set_mode((1, 1))
     
     # Создаем игрока на земле
@@ -71,8 +71,7 @@ def test_stopping():
         print("✅ УСПЕХ: Игрок корректно перешел в состояние idle при остановке")
     else:
         print(f"❌ ПРОБЛЕМА: Финальное состояние {final_state}, скорость {final_vel}")
-    
-    pygame.quit()
 
 if __name__ == "__main__":
-    test_stopping()
\ No newline at end of file
+    test_stopping()
+    pygame.quit()
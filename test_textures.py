@@ -3,11 +3,16 @@
 Test texture loading system
 """
 
+import os
 import pygame
 from game.assets import asset_manager
 from game.player import Player
 from game.physics import Vector2D
 
+# Sprites are only loaded and drawn to off-screen Surfaces: no real video/audio device needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
 
 def test_texture_loading():
     """Test that textures load correctly."""
@@ -42,6 +47,10 @@ def test_walk_animation_frames():
     
     print(f"✓ Loaded {len(frames)} walk animation frames")
     
+    # Повторный запрос возвращает тот же объект из кэша
+    assert asset_manager.get_walk_animation_frame(0, (32, 48)) is frames[0], \
+        "Walk frames should be cached"
+    
     # Check that frames are different (not all the same)
     frame_sizes = [frame.get_size() for frame in frames]
     print(f"✓ Frame sizes: {frame_sizes}")
@@ -49,6 +58,26 @@ def test_walk_animation_frames():
     print("✓ Walk animation frames test passed")
 
 
+def test_flipped_sprite_cache():
+    """Test that left-facing sprites are mirrored once and cached."""
+    print("Testing flipped sprite cache...")
+    
+    right_sprite = pygame.Surface((32, 48))
+    right_sprite.fill((0, 0, 0))
+    right_sprite.set_at((0, 0), (255, 0, 0))
+    left_sprite = asset_manager.get_flipped_image(right_sprite)
+    
+    assert left_sprite is not right_sprite, "Left sprite should be a separate surface"
+    assert left_sprite.get_size() == right_sprite.get_size(), "Flipped sprite should keep size"
+    assert left_sprite.get_at((31, 0))[:3] == (255, 0, 0), "Sprite should be mirrored horizontally"
+    
+    # Повторный запрос возвращает тот же объект из кэша
+    assert asset_manager.get_flipped_image(right_sprite) is left_sprite, \
+        "Flipped sprite should be cached"
+    
+    print("✓ Flipped sprite cache test passed")
+
+
 def test_player_sprite_integration():
     """Test player integration with sprite system."""
     print("Testing player sprite integration...")
@@ -120,6 +149,7 @@ def run_all_tests():
     try:
         test_texture_loading()
         test_walk_animation_frames()
+        test_flipped_sprite_cache()
         test_player_sprite_integration()
         test_sprite_rendering()
         